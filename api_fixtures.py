@@ -0,0 +1,86 @@
+"""
+This module provides a fixture factory that seeds the entities a test class needs through
+the Mission API, concurrently and before the class runs, and deletes them afterwards, so
+that only the tests exercising a create flow pay the cost of creating data through the UI.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from tests.mission_api import (BulkResult, MissionAPIDomainCustomer, MissionAPIDomainMap,
+                               MissionAPIDomainMission)
+
+
+class FixtureFactory:
+    """
+    Creates customers, maps and mission templates over HTTP and remembers them for cleanup.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        :param max_workers: The maximum number of concurrent requests, MISSION_API_BULK_WORKERS by default.
+        """
+        self.max_workers: int = max_workers or int(os.getenv("MISSION_API_BULK_WORKERS", "8"))
+        self.customers_api = MissionAPIDomainCustomer()
+        self.maps_api = MissionAPIDomainMap()
+        self.missions_api = MissionAPIDomainMission()
+        self.created: Dict[str, List[dict]] = {'customers': [], 'maps': [], 'missions': []}
+
+    def seed(self, customers: Iterable[dict] = (), maps: Iterable[dict] = (),
+             missions: Iterable[dict] = ()) -> Dict[str, List[dict]]:
+        """
+        Creates all the entities concurrently and returns them per kind, in the given order.
+        If any creation fails, the entities created so far are deleted and a ValueError is raised.
+
+        :param customers: The payloads of the customers to create.
+        :param maps: The payloads of the maps to create.
+        :param missions: The payloads of the mission templates to create.
+        """
+        creators = {'customers': self.customers_api.create_customer, 'maps': self.maps_api.create_map,
+                    'missions': self.missions_api.create_mission}
+        payloads = {'customers': list(customers), 'maps': list(maps), 'missions': list(missions)}
+        jobs = [(kind, payload) for kind, kind_payloads in payloads.items() for payload in kind_payloads]
+
+        seeded: Dict[str, List[dict]] = {kind: [] for kind in payloads}
+        errors: List[str] = []
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+                futures = [(kind, executor.submit(creators[kind], payload)) for kind, payload in jobs]
+                for kind, future in futures:
+                    try:
+                        seeded[kind].append(future.result())
+                    except Exception as e:
+                        errors.append(f"{kind}: {e}")
+
+        for kind, entities in seeded.items():
+            self.created[kind].extend(entities)
+        if errors:
+            self.cleanup()
+            raise ValueError(f"Seeding failed for {len(errors)} of {len(jobs)} entities: {'; '.join(errors)}")
+        return seeded
+
+    def cleanup(self) -> Dict[str, BulkResult]:
+        """
+        Deletes every entity created by the factory, concurrently, and returns the per-kind results.
+        Raises a ValueError listing the failures, if any.
+        """
+        created, self.created = self.created, {'customers': [], 'maps': [], 'missions': []}
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                'customers': executor.submit(self.customers_api.delete_customers,
+                                             [entity['id'] for entity in created['customers']]),
+                'maps': executor.submit(self.maps_api.delete_maps, [entity['id'] for entity in created['maps']]),
+                'missions': executor.submit(self.missions_api.delete_missions,
+                                            [entity['id'] for entity in created['missions']]),
+            }
+            results = {kind: future.result() for kind, future in futures.items()}
+
+        errors = []
+        for kind, result in results.items():
+            try:
+                result.raise_for_failures()
+            except ValueError as e:
+                errors.append(f"{kind}: {e}")
+        if errors:
+            raise ValueError(f"Fixture cleanup failed: {'; '.join(errors)}")
+        return results
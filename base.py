@@ -5,10 +5,11 @@ with elements.
 """
 import logging
 import os
+import shutil
 import time
 import unittest
-from typing import Optional, Tuple  # Combine typing imports and move them before third-party imports
-import psutil
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple  # Combine typing imports and move them before third-party imports
 from selenium import webdriver
 from selenium.common import TimeoutException
 from selenium.webdriver.chrome.webdriver import WebDriver
@@ -20,12 +21,72 @@ from selenium.webdriver.common.keys import Keys
 from chromedriver_py import binary_path as driver_path
 from faker import Faker
 
+from tests.api_fixtures import FixtureFactory
+from tests.mission_api import TOKEN_PROVIDER
+from tests.tracing import Tracer, bound_tracer, set_current_tracer, trace_path
+from tests.ux_tests.ui_tests.common.dom_scripts import FILL_FORM_JS, READ_TABLE_JS, READ_VALUES_JS, VISIBILITY_JS
+from tests.ux_tests.ui_tests.common.driver_pool import DRIVER_POOL, POOL_SCOPES
+from tests.ux_tests.ui_tests.common.memory_monitor import MEMORY_MONITOR, exceeded_limits
+from tests.ux_tests.ui_tests.common.network_profiles import NETWORK_PROFILES, apply_network_profile
+from tests.ux_tests.ui_tests.common.network_wait import UrlPattern, wait_for_requests
+from tests.ux_tests.ui_tests.common.parallel import WORKER, worker_id
+from tests.ux_tests.ui_tests.common.prewarm import PREWARMER
+from tests.ux_tests.ui_tests.common.profile_cache import PROFILE_TEMPLATE
+from tests.ux_tests.ui_tests.common.process_tracker import PROCESS_TRACKER
+from tests.ux_tests.ui_tests.common.settle import DEFAULT_SETTLE_TIMEOUT, install_settle_hooks, wait_for_settle
+from tests.ux_tests.ui_tests.common.step_chain import StepChain
+from tests.ux_tests.ui_tests.common.teardown_executor import TEARDOWN_EXECUTOR
+from tests.ux_tests.ui_tests.common.timeout_model import TIMEOUT_MODEL
+
+LOGIN_MODES = ('ui', 'token')
+
+# How long find_and_operate_on_element waits for its element to be present, without wait history
+STEP_TIMEOUT: float = 10
+
+# Writes the signed-in Firebase user where the Firebase JS SDK looks for it on startup
+# (IndexedDB for the default persistence, localStorage for browserLocalPersistence).
+INJECT_FIREBASE_USER_JS = """
+const [key, user, done] = arguments;
+window.localStorage.setItem(key, JSON.stringify(user));
+const request = indexedDB.open('firebaseLocalStorageDb', 1);
+request.onupgradeneeded = () => request.result.createObjectStore('firebaseLocalStorage', {keyPath: 'fbase_key'});
+request.onerror = () => done(false);
+request.onsuccess = () => {
+    const transaction = request.result.transaction('firebaseLocalStorage', 'readwrite');
+    transaction.objectStore('firebaseLocalStorage').put({fbase_key: key, value: user});
+    transaction.oncomplete = () => done(true);
+    transaction.onerror = () => done(false);
+};
+"""
+
 
 class InternalTestBase(unittest.TestCase):
     """
         Base class for UI tests, providing common setup, teardown, and utility functions
         for interacting with the web application.
      """
+    # Share one browser between tests: None (a new browser per test), 'class', 'module' or 'session'
+    driver_pool_scope: Optional[str] = os.environ.get('DRIVER_POOL_SCOPE') or None
+    # How setUp signs in: 'ui' types the credentials into the login form, 'token' injects
+    # the Firebase auth state of an API sign-in. Tests of the login form itself keep 'ui'.
+    login_mode: str = os.environ.get('LOGIN_MODE', 'ui')
+    # Name of the network profile blocking the resources the tests do not need (see network_profiles)
+    network_profile: Optional[str] = os.environ.get('NETWORK_PROFILE') or None
+    # Record the CDP Network events wait_for_requests reads (always on for pooled drivers, which
+    # may serve other classes); off by default, since chromedriver buffers every event until read
+    capture_network: bool = bool(os.environ.get('CAPTURE_NETWORK'))
+    # Launch and log in the browser of the next test in the background (only without a driver pool)
+    prewarm_driver: bool = bool(os.environ.get('PREWARM_DRIVER'))
+    # Run every test as one fail-fast step chain (see step_chain): the first failed step fails the test
+    fail_fast_steps: bool = bool(os.environ.get('FAIL_FAST_STEPS'))
+    # The step chain the steps currently run in, if any
+    _step_chain: Optional[StepChain] = None
+    # Recycle a pooled browser whose process tree RSS or JS heap grew past these limits, in MB
+    memory_rss_limit_mb: Optional[float] = float(os.environ['MEMORY_RSS_LIMIT_MB']) \
+        if os.environ.get('MEMORY_RSS_LIMIT_MB') else None
+    memory_js_heap_limit_mb: Optional[float] = float(os.environ['MEMORY_JS_HEAP_LIMIT_MB']) \
+        if os.environ.get('MEMORY_JS_HEAP_LIMIT_MB') else None
+
     @classmethod
     def setUpClass(cls):
         cls.is_logged_in: bool = False
@@ -33,24 +94,163 @@ class InternalTestBase(unittest.TestCase):
         cls.max_wait_time: int = 20
         cls.base_url: str = os.environ.get('LOGIN_URL')
         cls.faker: Optional[Faker] = None
+        cls.fixtures: Optional[FixtureFactory] = None
+        cls.seeded: Dict[str, List[dict]] = {}
+        if cls.driver_pool_scope is not None and cls.driver_pool_scope not in POOL_SCOPES:
+            raise ValueError(f"Unknown driver pool scope: {cls.driver_pool_scope}, expected one of {POOL_SCOPES}")
+        if cls.login_mode not in LOGIN_MODES:
+            raise ValueError(f"Unknown login mode: {cls.login_mode}, expected one of {LOGIN_MODES}")
+        if cls.network_profile is not None and cls.network_profile not in NETWORK_PROFILES:
+            raise ValueError(f"Unknown network profile: {cls.network_profile}, "
+                             f"expected one of {tuple(NETWORK_PROFILES)}")
+
+        payloads = cls.fixture_payloads()
+        if any(payloads.values()):
+            cls.fixtures = FixtureFactory()
+            cls.seeded = cls.fixtures.seed(**payloads)
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.driver_pool_scope == 'class':
+            DRIVER_POOL.discard(cls._pool_key())
+        if cls.prewarm_driver:
+            PREWARMER.discard()
+        # Wait for the deferred cleanups of the class, so its entities are deleted before the fixtures
+        errors = [f"{description}: {error}" for description, error in TEARDOWN_EXECUTOR.flush()]
+        if cls.fixtures is not None:
+            try:
+                cls.fixtures.cleanup()
+            except Exception as e:
+                errors.append(str(e))
+        if errors:
+            raise RuntimeError(f"{len(errors)} class cleanups failed: {'; '.join(errors)}")
+
+    @classmethod
+    def fixture_payloads(cls) -> Dict[str, List[dict]]:
+        """
+        Returns the entities to seed through the Mission API before the class runs, as
+        {'customers': [...], 'maps': [...], 'missions': [...]} payload lists. The created
+        entities are available in cls.seeded under the same keys and deleted after the class.
+        """
+        return {}
+
+    @classmethod
+    def _pool_key(cls):
+        """
+        Returns the key under which the class shares its pooled driver.
+        """
+        if cls.driver_pool_scope == 'class':
+            return cls
+        if cls.driver_pool_scope == 'module':
+            return cls.__module__
+        return 'session'
 
     def setUp(self):
-        self._login()
+        self.tracer = Tracer(self.id())
+        set_current_tracer(self.tracer)
+        # Cleanups run after every tearDown, so the trace also covers the subclasses' API cleanup
+        self.addCleanup(self.__export_trace)
+        self._step_chain = None
+        if self.fail_fast_steps:
+            self._step_chain = StepChain()
+            self.addCleanup(self.__check_step_chain, self._step_chain)
+
+        prewarmed_driver = PREWARMER.take(type(self)) if self.__uses_prewarm() else None
+        if prewarmed_driver is not None:
+            self._driver = prewarmed_driver
+        else:
+            self._login()
+        if self.__uses_prewarm():
+            PREWARMER.submit(type(self), self.__launch_logged_in_driver)
+        if self.__monitors_memory() and self._driver is not None:
+            MEMORY_MONITOR.start(self.id(), self._driver)
         self.faker = Faker()
 
+    def __uses_prewarm(self) -> bool:
+        return self.prewarm_driver and self.driver_pool_scope is None
+
+    def __monitors_memory(self) -> bool:
+        return (MEMORY_MONITOR.report_path is not None or self.memory_rss_limit_mb is not None
+                or self.memory_js_heap_limit_mb is not None)
+
+    def __captures_network(self) -> bool:
+        return self.capture_network or self.driver_pool_scope is not None
+
+    def __launch_logged_in_driver(self) -> WebDriver:
+        """
+        Launches and logs in a driver for the next test of the class. Runs on the pre-warm
+        thread, through a separate instance so that it shares no state with the running test.
+        """
+        warm_case = type(self)(self._testMethodName)
+        warm_case.tracer = Tracer(f'prewarm {type(self).__name__}')
+        warm_case._login()
+        return warm_case._driver
+
     def tearDown(self):
-        self._driver.quit()
+        exceeded = []
+        if self.__monitors_memory() and self._driver is not None:
+            with self.tracer.span('memory') as memory:
+                memory.update(MEMORY_MONITOR.stop(self.id(), self._driver))
+            exceeded = exceeded_limits(memory, self.memory_rss_limit_mb, self.memory_js_heap_limit_mb)
+
+        if self.driver_pool_scope is not None:
+            if self._driver is not None and exceeded:
+                logging.warning('Recycling the pooled driver after %s: %s', self.id(), ', '.join(exceeded))
+                DRIVER_POOL.discard(self._pool_key(), self._driver)
+            elif self._driver is not None:
+                DRIVER_POOL.release(self._pool_key(), self._driver)
+            return
+
+        if self._driver is not None:
+            # Quit the driver and reap its own process tree without blocking the next test
+            self.defer_cleanup(f'quit the driver of {self.id()}', PROCESS_TRACKER.reap, self._driver)
+
+    def defer_cleanup(self, description: str, job: Callable, *args, **kwargs) -> None:
+        """
+        Runs a cleanup job (quitting a driver, deleting entities...) in the background, so the
+        next test starts without waiting for it. Failures are raised at the end of the class.
+        The spans of the job are recorded in the trace of this test, exported again once it ends.
+
+        :param description: What the job does, used when reporting its failure.
+        :param job: The callable to run.
+        """
+        TEARDOWN_EXECUTOR.submit(description, self.__run_deferred, job, args, kwargs)
 
-        # Get the process IDs of Selenium Chrome processes before running tests
-        selenium_chrome_pids = [proc.pid for proc in psutil.process_iter(['pid', 'name', 'cmdline'])
-                                if 'chrome' in proc.name() and 'chromedriver' in proc.cmdline()]
+    def __run_deferred(self, job: Callable, args: tuple, kwargs: dict) -> None:
+        try:
+            with bound_tracer(self.tracer):
+                job(*args, **kwargs)
+        finally:
+            self.__export_trace()
 
-        # Clean up Selenium Chrome processes
-        for pid in selenium_chrome_pids:
-            try:
-                psutil.Process(pid).terminate()
-            except psutil.NoSuchProcess:
-                pass
+    @contextmanager
+    def step_chain(self):
+        """
+        Runs the steps of the block as a fail-fast chain: after the first failed
+        find_and_operate_on_element, the following ones return immediately, and the test fails
+        at the end of the block with the failing locator and the wait time the chain skipped.
+        """
+        outer_chain, self._step_chain = self._step_chain, StepChain()
+        chain = self._step_chain
+        try:
+            yield chain
+        except Exception as e:
+            # Code between the steps may fail because of the failed step: report the step instead
+            if not chain.failed:
+                raise
+            self.fail(f"{chain.report()}; then: {e!r}")
+        finally:
+            self._step_chain = outer_chain
+        self.__check_step_chain(chain)
+
+    def __check_step_chain(self, chain: StepChain) -> None:
+        if chain.failed:
+            self.fail(chain.report())
+
+    def __export_trace(self) -> None:
+        trace_dir = os.environ.get('TEST_TRACE_DIR')
+        if trace_dir:
+            self.tracer.export(trace_path(trace_dir, self.id()))
 
     @property
     def driver(self):
@@ -70,21 +270,133 @@ class InternalTestBase(unittest.TestCase):
         return self._driver
 
     def __init_driver(self) -> None:
+        if self.driver_pool_scope is not None:
+            self._driver = DRIVER_POOL.acquire(self._pool_key(), self._create_driver)
+        else:
+            self._driver = self._create_driver()
+
+        # A pooled driver may still carry the profile of the class that used it before
+        if self.network_profile is not None or self.driver_pool_scope is not None:
+            apply_network_profile(self._driver, self.network_profile or 'none')
+
+    def _create_driver(self, user_data_dir: Optional[str] = None) -> WebDriver:
+        """
+        Launches a new Chrome WebDriver with the options used by the tests.
+
+        :param user_data_dir: The profile directory to launch Chrome on. By default, a copy of
+            the profile template when CHROME_PROFILE_TEMPLATE is set, and a fresh directory per
+            driver in parallel workers.
+        """
         # Configure Chrome options
         chrome_options = webdriver.ChromeOptions()
         # chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--remote-debugging-port=9223')
+        debugging_port = WORKER.debugging_port()
+        if debugging_port is not None:
+            chrome_options.add_argument(f'--remote-debugging-port={debugging_port}')
+        if self.__captures_network():
+            # Exposes the CDP Network events to wait_for_requests
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        # The per-driver profile directory, deleted when the driver is reaped
+        own_user_data_dir = None
+        if user_data_dir is None and PROFILE_TEMPLATE.enabled:
+            # Start from the warmed HTTP cache of the template instead of an empty profile
+            PROFILE_TEMPLATE.ensure_built(self.__build_profile_template)
+            own_user_data_dir = user_data_dir = WORKER.new_user_data_dir()
+            PROFILE_TEMPLATE.clone(user_data_dir)
+        elif user_data_dir is None and worker_id() is not None:
+            # Parallel workers must not share a profile directory
+            own_user_data_dir = user_data_dir = WORKER.new_user_data_dir()
+        if user_data_dir is not None:
+            chrome_options.add_argument(f'--user-data-dir={user_data_dir}')
 
         # Start the WebDriver
-        service = Service(driver_path)
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        self._driver = driver
+        service = Service(driver_path, env=WORKER.service_env())
+        try:
+            with self.tracer.span('driver.start'):
+                driver = webdriver.Chrome(service=service, options=chrome_options)
+        except Exception:
+            if own_user_data_dir is not None:
+                shutil.rmtree(own_user_data_dir, ignore_errors=True)
+            raise
+        PROCESS_TRACKER.track(driver, own_user_data_dir)
+        install_settle_hooks(driver)
+        return driver
+
+    def __build_profile_template(self, user_data_dir: str) -> None:
+        """
+        Warms the HTTP cache of the profile template by loading the login page, without signing in.
+        """
+        with self.tracer.span('profile_template.build'):
+            driver = self._create_driver(user_data_dir)
+            try:
+                driver.get(os.getenv('LOGIN_URL'))
+                wait_for_settle(driver, timeout=self.max_wait_time)
+            finally:
+                # A clean quit flushes the cache index to disk
+                PROCESS_TRACKER.reap(driver)
 
     def _login(self) -> None:
+        """
+        Logs in to the web application according to the login mode of the test class.
+        """
+        with self.tracer.span('login', mode=self.login_mode):
+            if self.login_mode == 'token':
+                self._login_with_token()
+            else:
+                self._login_with_form()
+
+    def _login_with_token(self) -> None:
+        """
+        Logs in without the login form by injecting the auth state of a Firebase API sign-in.
+        The sign-in is shared by all the tests and worker processes through the token provider.
+        """
+        self.driver.maximize_window()
+        login_url = os.getenv('LOGIN_URL')
+        auth = TOKEN_PROVIDER.auth()
+        api_key = os.getenv('FIREBASE_TOKEN')
+        now_ms = int(time.time() * 1000)
+        user = {
+            'uid': auth['localId'],
+            'email': auth['email'],
+            'emailVerified': False,
+            'isAnonymous': False,
+            'providerData': [{'providerId': 'password', 'uid': auth['email'], 'email': auth['email'],
+                              'displayName': None, 'phoneNumber': None, 'photoURL': None}],
+            'stsTokenManager': {
+                'refreshToken': auth['refreshToken'],
+                'accessToken': auth['idToken'],
+                'expirationTime': int(auth['expiresAt'] * 1000),
+            },
+            'createdAt': str(now_ms),
+            'lastLoginAt': str(now_ms),
+            'apiKey': api_key,
+            'appName': '[DEFAULT]',
+        }
+
+        # The storage is per origin, so the app has to be open before the user can be written
+        self.driver.get(login_url)
+        injected = self.driver.execute_async_script(
+            INJECT_FIREBASE_USER_JS, f'firebase:authUser:{api_key}:[DEFAULT]', user
+        )
+        if not injected:
+            logging.error('Failed to inject the Firebase auth state, falling back to the login form')
+            self._login_with_form()
+            return
+        self.driver.get(login_url)
+
+        try:
+            self.wait_for_element(
+                (By.XPATH, "//h5[contains(@class, 'MuiTypography-h5') and text()='Highlights']"),
+                EC.visibility_of_element_located, self.max_wait_time
+            )
+            logging.info('Login with injected token successful')
+        except TimeoutException:
+            logging.error('Login with injected token failed: Highlights heading is not displayed')
+
+    def _login_with_form(self) -> None:
         """
         Logs in to the web application using the provided email and password.
         """
@@ -115,20 +427,20 @@ class InternalTestBase(unittest.TestCase):
 
         try:
             logging.debug('Waiting for Highlights heading...')
-            highlights_heading = WebDriverWait(self.driver, self.max_wait_time).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//h5[contains(@class, 'MuiTypography-h5') and text()='Highlights']")
-                )
+            highlights_heading = self.wait_for_element(
+                (By.XPATH, "//h5[contains(@class, 'MuiTypography-h5') and text()='Highlights']"),
+                timeout=self.max_wait_time
             )
             logging.debug('Checking if Highlights heading is displayed...')
             assert highlights_heading.is_displayed()
-            time.sleep(5)
+            self.wait_for_settle()
             logging.info('Login successful')
         except TimeoutException:
             pass
             # pytest.fail("Login failed: Highlights heading is not displayed")
 
-    def find_and_operate_on_element(self, locator_tuple, operation, operation_args=(), clear_field=False):
+    def find_and_operate_on_element(self, locator_tuple, operation, operation_args=(), clear_field=False,
+                                    record_history=True):
         """
         Wait for the element to be located by its locator and then perform an operation on it.
 
@@ -136,32 +448,194 @@ class InternalTestBase(unittest.TestCase):
         :param operation: The function to be executed on the located element.
         :param operation_args: Arguments for the operation function.
         :param clear_field: If True, clears the field before performing the operation.
+        :param record_history: False for locators that change every run (e.g. the ID of a seeded
+            entity), which would only add keys to the wait history; they keep the static timeout.
+
+        Errors are logged, unless the step runs in a step chain (see step_chain), which they fail.
         """
-        try:
-            # Wait for the element to be present and visible
-            web_element = WebDriverWait(self.driver, 10).until(EC.presence_of_element_located(locator_tuple))
+        with self.tracer.span('step', locator=f'{locator_tuple[0]}={locator_tuple[1]}',
+                              operation=operation.__name__) as step:
+            chain = self._step_chain
+            if chain is not None and chain.failed:
+                # An earlier step of the chain failed, do not wait for this one
+                step['skipped'] = True
+                budget = TIMEOUT_MODEL.budget(locator_tuple, STEP_TIMEOUT) if record_history else STEP_TIMEOUT
+                chain.skip(locator_tuple, budget + DEFAULT_SETTLE_TIMEOUT)
+                return
 
-            # Clear the field if needed
-            if clear_field:
-                web_element.send_keys(Keys.CONTROL + "a")
-                web_element.send_keys(Keys.DELETE)
+            try:
+                # Wait for the element to be present and visible
+                started = time.perf_counter()
+                web_element = self.wait_for_element(locator_tuple, record_history=record_history)
+                step['wait_time'] = time.perf_counter() - started
+
+                # Clear the field if needed
+                started = time.perf_counter()
+                if clear_field:
+                    web_element.send_keys(Keys.CONTROL + "a")
+                    web_element.send_keys(Keys.DELETE)
+
+                # Scroll the element into view
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", web_element)
+
+                # Use JavaScript click for robustness
+                operation(web_element, *operation_args)
+                step['action_time'] = time.perf_counter() - started
+
+                # Wait until the requests and re-renders triggered by the operation are done
+                started = time.perf_counter()
+                self.wait_for_settle()
+                step['settle_time'] = time.perf_counter() - started
+
+            except TimeoutException:
+                step['error'] = 'timeout'
+                logging.error('Element with locator %s not found or not clickable, operation: %s', locator_tuple,
+                              operation.__name__)
+            except Exception as e:
+                step['error'] = str(e)
+                logging.error(f"An error occurred during operation: {e}")
+
+            if chain is not None and 'error' in step:
+                chain.record_failure(locator_tuple, operation.__name__, step['error'])
+
+    def wait_for_element(self, locator_tuple: Tuple[str, str], condition=EC.presence_of_element_located,
+                         timeout: float = STEP_TIMEOUT, record_history: bool = True):
+        """
+        Waits for an expected condition on a locator, for the budget the timeout model derives
+        from the wait history of the locator (the static timeout without history), and records
+        the time the wait took, also when it timed out within an adaptive budget.
 
-            # Scroll the element into view
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", web_element)
+        :param locator_tuple: A tuple containing the strategy and the locator (e.g., (By.ID, 'element_id')).
+        :param condition: The expected condition factory, called with the locator.
+        :param timeout: The static timeout, also the upper bound of the adaptive budget.
+        :param record_history: False for locators that change every run, which wait for the static
+            timeout and are kept out of the wait history.
+        :return: The value returned by the condition, usually the element.
+        """
+        if not record_history:
+            return WebDriverWait(self.driver, timeout).until(condition(locator_tuple))
+        budget = TIMEOUT_MODEL.budget(locator_tuple, timeout)
+        started = time.perf_counter()
+        try:
+            result = WebDriverWait(self.driver, budget).until(condition(locator_tuple))
+        except TimeoutException:
+            if budget < timeout:
+                # The history may be stale: the censored sample makes the next budget larger
+                logging.warning('Wait on %s timed out after its adaptive budget of %.1fs (static timeout %.1fs)',
+                                locator_tuple, budget, timeout)
+                TIMEOUT_MODEL.record(locator_tuple, time.perf_counter() - started)
+            raise
+        TIMEOUT_MODEL.record(locator_tuple, time.perf_counter() - started)
+        return result
+
+    def fill_form(self, fields: Dict[Tuple[str, str], str], timeout: float = 10) -> None:
+        """
+        Sets the values of many form fields at once and verifies them.
 
-            # Use JavaScript click for robustness
-            operation(web_element, *operation_args)
+        All the fields are located and filled in a single execute_script call, firing the
+        input and change events React/MUI listen to, and read back in a second call.
+        Fails the test if a field is still missing after the timeout or did not keep its value.
+
+        :param fields: A mapping of locator tuples (e.g., (By.ID, 'element_id')) to the values to set.
+        :param timeout: How long to wait for all the fields to be present.
+        """
+        with self.tracer.span('fill_form', fields=len(fields)):
+            self.__fill_form(fields, timeout)
 
-            WebDriverWait(self.driver, 5).until(EC.element_to_be_clickable(locator_tuple))
-            time.sleep(1)  # Optional: small wait to ensure element is ready
+    def __fill_form(self, fields: Dict[Tuple[str, str], str], timeout: float) -> None:
+        locators = list(fields)
+        field_specs = [[by, value, str(text)] for (by, value), text in fields.items()]
 
+        missing = []
 
+        def fill(driver):
+            missing[:] = driver.execute_script(FILL_FORM_JS, field_specs)
+            return not missing
 
+        try:
+            WebDriverWait(self.driver, timeout).until(fill)
         except TimeoutException:
-            logging.error('Element with locator %s not found or not clickable, operation: %s', locator_tuple,
-                          operation.__name__)
-        except Exception as e:
-            logging.error(f"An error occurred during operation: {e}")
+            self.fail(f"Form fields not found: {[locators[index] for index in missing]}")
+
+        values = self.driver.execute_script(READ_VALUES_JS, [[by, value] for by, value in locators])
+        mismatches = {locator: (str(expected), actual)
+                      for (locator, expected), actual in zip(fields.items(), values) if actual != str(expected)}
+        if mismatches:
+            self.fail(f"Form fields did not keep their values (expected, actual): {mismatches}")
+
+        self.wait_for_settle()
+
+    def assert_all_visible(self, locators: Iterable[Tuple[str, str]],
+                           timeout: float = 10) -> Dict[Tuple[str, str], dict]:
+        """
+        Waits until every element is present and displayed, checking all of them in a single
+        execute_script call per poll, and fails the test with the elements still missing
+        once the shared timeout expires.
+
+        :param locators: The locator tuples of the elements (e.g., (By.ID, 'element_id')).
+        :param timeout: The timeout shared by all the elements.
+        :return: A report mapping every locator to its {'present': bool, 'displayed': bool} state.
+        """
+        locators = list(locators)
+        report: Dict[Tuple[str, str], dict] = {}
+
+        def check(driver):
+            states = driver.execute_script(VISIBILITY_JS, [[by, value] for by, value in locators])
+            report.update(zip(locators, states))
+            return all(state['displayed'] for state in states)
+
+        with self.tracer.span('assert_all_visible', locators=len(locators)):
+            try:
+                WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(check)
+            except TimeoutException:
+                failed = {locator: state for locator, state in report.items() if not state['displayed']}
+                self.fail(f"Elements not found or not displayed: {failed}")
+        return report
+
+    def read_table(self, locator_tuple: Optional[Tuple[str, str]] = None, timeout: float = 10) -> dict:
+        """
+        Reads a whole table and its pagination in a single execute_script call.
+
+        :param locator_tuple: The locator of the table, by default the first table on the page.
+        :param timeout: How long to wait for the table to be present.
+        :return: A dict with 'headers', 'rows' (each with the row 'id' and its 'cells' text by
+            column header) and 'pagination' ('text', 'from', 'to' and 'total', or None without
+            a pagination element; 'total' is None when the table only reports "more than").
+        """
+        locator = list(locator_tuple) if locator_tuple else None
+        with self.tracer.span('read_table'):
+            try:
+                return WebDriverWait(self.driver, timeout).until(
+                    lambda driver: driver.execute_script(READ_TABLE_JS, locator)
+                )
+            except TimeoutException:
+                self.fail(f"Table {locator_tuple or 'table'} not found")
+
+    def wait_for_requests(self, action: Callable[[], None], url_patterns: Iterable[UrlPattern] = (),
+                          timeout: float = 10, return_body: bool = False) -> List[dict]:
+        """
+        Performs the action and waits until the API requests it triggered have finished,
+        based on the CDP Network events of the browser.
+
+        :param action: The action triggering the requests, e.g. clicking the filter button.
+        :param url_patterns: Substrings (or compiled regexes) of the request URLs to wait for, e.g. '/customer?'.
+        :param timeout: The maximum time to wait, in seconds.
+        :param return_body: Whether to return the response bodies.
+        :return: The finished requests, as dicts with url, method, status, failed and (optionally) body.
+        """
+        if not self.__captures_network():
+            raise ValueError(f"wait_for_requests needs the network events: set capture_network = True "
+                             f"on {type(self).__name__} or CAPTURE_NETWORK")
+        url_patterns = list(url_patterns)
+        with self.tracer.span('wait_for_requests', patterns=[str(pattern) for pattern in url_patterns]):
+            return wait_for_requests(self.driver, action, url_patterns, timeout, return_body=return_body)
+
+    def wait_for_settle(self, timeout: float = DEFAULT_SETTLE_TIMEOUT) -> bool:
+        """
+        Waits until the page is quiet: no fetch/XHR request in flight and no DOM mutation
+        for a short quiet period. Returns False if the page is still busy after the timeout.
+        """
+        return wait_for_settle(self.driver, timeout=timeout)
 
     def scroll_and_save_container(self):
         """
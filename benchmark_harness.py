@@ -0,0 +1,183 @@
+"""
+This module benchmarks the overhead of the test harness itself against the local stub
+server: driver startup, login, find_and_operate_on_element, scroll_and_save_container and
+MissionAPI get/delete throughput. Results are compared with a JSON baseline and the run
+fails when the p50 or p95 of a benchmark regresses beyond the threshold.
+
+Usage:
+    python -m tests.benchmark_harness --baseline benchmarks/baseline.json
+    python -m tests.benchmark_harness --baseline benchmarks/baseline.json --update-baseline
+    python -m tests.benchmark_harness --baseline benchmarks/baseline.json --no-browser
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from tests.mission_api import TOKEN_PROVIDER, MissionAPIDomainMap
+from tests.stats import percentile
+from tests.stub_server import StubServer
+
+
+def measure(operation: Callable[[], None], iterations: int, warmup: int = 1,
+            before_each: Optional[Callable[[], None]] = None) -> Dict[str, float]:
+    """
+    Times the operation and returns its p50, p95 and mean durations in seconds.
+
+    :param operation: The operation to time.
+    :param iterations: The number of timed runs.
+    :param warmup: The number of untimed runs done first.
+    :param before_each: An untimed preparation step run before every run.
+    """
+    samples = []
+    for index in range(warmup + iterations):
+        if before_each is not None:
+            before_each()
+        started = time.perf_counter()
+        operation()
+        if index >= warmup:
+            samples.append(time.perf_counter() - started)
+    return {'p50': percentile(samples, 50), 'p95': percentile(samples, 95), 'mean': statistics.mean(samples),
+            'samples': len(samples)}
+
+
+def benchmark_mission_api(server: StubServer, iterations: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measures the latency of MissionAPI get and delete calls against the stub API.
+    """
+    api = MissionAPIDomainMap()
+    api.token()
+    map_ids = [server.store.create('maps', {'name': f'benchmark {index}'})['id']
+               for index in range(iterations + 1)]
+
+    results = {'mission_api.get': measure(lambda: api.get_map(map_ids[0]), iterations)}
+    pending = list(map_ids)
+    results['mission_api.delete'] = measure(lambda: api.delete_map(pending.pop()), iterations)
+    for name in ('mission_api.get', 'mission_api.delete'):
+        results[name]['throughput'] = 1 / results[name]['mean']
+    return results
+
+
+def benchmark_browser(iterations: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measures the browser side of the harness: driver startup, login and element operations.
+    """
+    # Imported here so that the API benchmarks run on hosts without Chrome
+    from selenium.webdriver.common.by import By
+    from tests.tracing import Tracer
+    from tests.ux_tests.ui_tests.common.base import InternalTestBase
+    from tests.ux_tests.ui_tests.common.driver_pool import DriverPool
+    from tests.ux_tests.ui_tests.common.process_tracker import PROCESS_TRACKER
+
+    class BenchmarkCase(InternalTestBase):
+        """
+        An InternalTestBase instance driven outside of unittest.
+        """
+        def runTest(self):
+            pass
+
+    BenchmarkCase.setUpClass()
+    case = BenchmarkCase()
+    case.tracer = Tracer('benchmark')
+
+    results = {'driver.startup': measure(lambda: PROCESS_TRACKER.reap(case._create_driver()), iterations)}
+
+    case._driver = case._create_driver()
+    try:
+        results['login'] = measure(case._login, iterations, before_each=lambda: DriverPool.reset(case.driver))
+
+        case.find_and_operate_on_element((By.ID, 'customers'), lambda we: we.click())
+
+        def no_operation(web_element):
+            return web_element
+
+        results['find_and_operate_on_element'] = measure(
+            lambda: case.find_and_operate_on_element((By.ID, 'name'), no_operation), iterations
+        )
+
+        case.find_and_operate_on_element((By.ID, '91c95f6c-cbf7-4115-a79d-d67c1fea0dfd'), lambda we: we.click())
+        results['scroll_and_save_container'] = measure(case.scroll_and_save_container, iterations)
+    finally:
+        PROCESS_TRACKER.reap(case._driver)
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float,
+            min_delta: float) -> List[str]:
+    """
+    Returns a description of every p50/p95 that regressed beyond the threshold.
+
+    :param threshold: The allowed relative slowdown, e.g. 0.2 for 20%.
+    :param min_delta: The absolute slowdown in seconds below which a change is treated as noise.
+    """
+    regressions = []
+    for name, result in results.items():
+        for stat in ('p50', 'p95'):
+            if name not in baseline:
+                continue
+            reference = baseline[name][stat]
+            if result[stat] > reference * (1 + threshold) and result[stat] - reference > min_delta:
+                regressions.append(f"{name} {stat}: {result[stat] * 1000:.1f} ms vs baseline "
+                                   f"{reference * 1000:.1f} ms (+{(result[stat] / reference - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the benchmarks and checks them against the baseline.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the test harness against the local stub server.')
+    parser.add_argument('--baseline', required=True, help='The JSON baseline to compare with')
+    parser.add_argument('--update-baseline', action='store_true', help='Write the results as the new baseline')
+    parser.add_argument('--iterations', type=int, default=20, help='Timed runs per benchmark')
+    parser.add_argument('--latency-ms', type=float, default=0, help='Latency of the stub server')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Allowed relative regression')
+    parser.add_argument('--min-delta-ms', type=float, default=5, help='Regressions smaller than this are noise')
+    parser.add_argument('--no-browser', action='store_true', help='Only run the benchmarks that need no Chrome')
+    args = parser.parse_args(argv)
+
+    with StubServer(latency=args.latency_ms / 1000) as server:
+        os.environ.update({
+            'LOGIN_URL': server.url,
+            'MISSION_API_URL': server.api_url,
+            'FIREBASE_AUTH_URL': server.url,
+            'FIREBASE_SECURETOKEN_URL': server.url,
+            'FIREBASE_TOKEN': 'stub',
+            'VALID_EMAIL': 'benchmark@example.com',
+            'VALID_PASSWORD': 'benchmark',
+        })
+        TOKEN_PROVIDER.cache_path = os.path.join(tempfile.mkdtemp(prefix='benchmark-'), 'token.json')
+
+        results = benchmark_mission_api(server, args.iterations)
+        if not args.no_browser:
+            results.update(benchmark_browser(args.iterations))
+
+    for name, result in results.items():
+        print(f"{name:32s} p50 {result['p50'] * 1000:8.1f} ms  p95 {result['p95'] * 1000:8.1f} ms")
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+    except FileNotFoundError:
+        print(f"No baseline at {args.baseline}, run with --update-baseline first")
+        return 1
+
+    regressions = compare(results, baseline, args.threshold, args.min_delta_ms / 1000)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
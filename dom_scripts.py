@@ -0,0 +1,93 @@
+"""
+This module holds JavaScript snippets shared by the helpers that work on many elements
+in a single execute_script call instead of one WebDriver round trip per element.
+"""
+
+# Defines resolveLocator(by, value), which finds the first element matching a Selenium
+# (By.*, value) locator tuple, or returns null. Prepend it to scripts that receive locators.
+RESOLVE_LOCATOR_JS = """
+function resolveLocator(by, value) {
+    switch (by) {
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+        case 'css selector': return document.querySelector(value);
+        case 'xpath':
+            return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+                .singleNodeValue;
+        case 'link text':
+            return Array.from(document.querySelectorAll('a')).find((a) => a.textContent.trim() === value) || null;
+        case 'partial link text':
+            return Array.from(document.querySelectorAll('a')).find((a) => a.textContent.includes(value)) || null;
+        default: throw new Error('Unsupported locator strategy: ' + by);
+    }
+}
+"""
+
+# Sets the value of every [by, value, text] field, but only once all of them are present.
+# The native value setter plus bubbling input/change events make React (and MUI) see the
+# change exactly as if it had been typed. Returns the indexes of the missing fields.
+FILL_FORM_JS = RESOLVE_LOCATOR_JS + """
+const fields = arguments[0];
+const elements = fields.map(([by, value]) => resolveLocator(by, value));
+const missing = elements.map((element, index) => element ? -1 : index).filter((index) => index >= 0);
+if (missing.length) { return missing; }
+elements.forEach((element, index) => {
+    const prototype = element instanceof HTMLTextAreaElement
+        ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    element.focus();
+    Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, fields[index][2]);
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+    element.blur();
+});
+return [];
+"""
+
+# Returns the current value of every [by, value] field (null when the field is gone).
+READ_VALUES_JS = RESOLVE_LOCATOR_JS + """
+return arguments[0].map(([by, value]) => {
+    const element = resolveLocator(by, value);
+    return element ? element.value : null;
+});
+"""
+
+# Reports, for every [by, value] locator, whether the element is present and displayed
+# (rendered with a non-empty box and not hidden by visibility).
+VISIBILITY_JS = RESOLVE_LOCATOR_JS + """
+return arguments[0].map(([by, value]) => {
+    const element = resolveLocator(by, value);
+    const displayed = !!element && element.getClientRects().length > 0
+        && window.getComputedStyle(element).visibility !== 'hidden';
+    return {present: !!element, displayed: displayed};
+});
+"""
+
+# Serializes a table (the one matching the optional [by, value] locator, or the first one on
+# the page) with its MUI pagination text: headers, rows with their id and cell text by header,
+# and the from/to/total numbers parsed from e.g. '1–10 of 57'. Returns null without a table.
+READ_TABLE_JS = RESOLVE_LOCATOR_JS + """
+const locator = arguments[0];
+const table = locator ? resolveLocator(locator[0], locator[1]) : document.querySelector('table');
+if (!table) { return null; }
+const headers = Array.from(table.querySelectorAll('thead th')).map((th) => th.textContent.trim());
+const rows = Array.from(table.querySelectorAll('tbody tr')).map((tr) => {
+    const cells = {};
+    Array.from(tr.children).forEach((cell, index) => { cells[headers[index] || String(index)] = cell.textContent.trim(); });
+    return {id: tr.id || null, cells: cells};
+});
+const displayedRows = document.querySelector('.MuiTablePagination-displayedRows');
+let pagination = null;
+if (displayedRows) {
+    const text = displayedRows.textContent.trim();
+    const match = text.match(/(\\d+)\\s*[–-]\\s*(\\d+)\\s+of\\s+(more than\\s+)?(\\d+)/);
+    pagination = {
+        text: text,
+        from: match ? Number(match[1]) : null,
+        to: match ? Number(match[2]) : null,
+        total: match && !match[3] ? Number(match[4]) : null,
+    };
+}
+return {headers: headers, rows: rows, pagination: pagination};
+"""
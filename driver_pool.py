@@ -0,0 +1,137 @@
+"""
+This module provides a pool of reusable Selenium WebDriver instances, so that a single
+Chrome browser can be shared by the tests of a class, a module or the whole session
+instead of being launched and quit for every test.
+"""
+import atexit
+import logging
+import threading
+from typing import Callable, Dict, Hashable, List, Optional
+
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from tests.ux_tests.ui_tests.common.process_tracker import PROCESS_TRACKER
+
+POOL_SCOPES = ('class', 'module', 'session')
+
+
+class DriverPool:
+    """
+    Keeps one idle WebDriver per scope key and hands it to the next test that asks for it.
+
+    Drivers are reset between tests (extra tabs closed, cookies and storage cleared,
+    blank page loaded) and health-checked before reuse. A driver that fails the
+    health check or the reset is quit and replaced by a fresh one.
+    """
+
+    def __init__(self):
+        self._idle: Dict[Hashable, WebDriver] = {}
+        self._in_use: Dict[Hashable, WebDriver] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable, factory: Callable[[], WebDriver]) -> WebDriver:
+        """
+        Returns the idle driver registered under the key, or a new one built by the factory.
+
+        :param key: The scope key the driver belongs to (class, module name or 'session').
+        :param factory: A callable that launches a new WebDriver.
+        """
+        with self._lock:
+            driver = self._idle.pop(key, None)
+
+        if driver is not None and not self.is_healthy(driver):
+            logging.warning('Pooled driver for %s is not responding, recycling it', key)
+            self._quit(driver)
+            driver = None
+
+        if driver is None:
+            driver = factory()
+
+        with self._lock:
+            self._in_use[key] = driver
+        return driver
+
+    def release(self, key: Hashable, driver: WebDriver) -> None:
+        """
+        Resets the driver and puts it back in the pool for the next test of the same scope.
+        """
+        with self._lock:
+            self._in_use.pop(key, None)
+
+        if not self.is_healthy(driver) or not self.reset(driver):
+            logging.warning('Pooled driver for %s could not be reset, recycling it', key)
+            self._quit(driver)
+            return
+
+        with self._lock:
+            previous = self._idle.pop(key, None)
+            self._idle[key] = driver
+        if previous is not None and previous is not driver:
+            self._quit(previous)
+
+    def discard(self, key: Hashable, driver: Optional[WebDriver] = None) -> None:
+        """
+        Quits the driver registered under the key, so the next acquire launches a new one.
+        """
+        with self._lock:
+            drivers = [self._idle.pop(key, None), self._in_use.pop(key, None), driver]
+        for pooled in {id(d): d for d in drivers if d is not None}.values():
+            self._quit(pooled)
+
+    def close(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> None:
+        """
+        Quits every pooled driver, or only those whose key matches the predicate.
+        """
+        with self._lock:
+            keys: List[Hashable] = [key for key in list(self._idle) + list(self._in_use)
+                                    if predicate is None or predicate(key)]
+        for key in keys:
+            self.discard(key)
+
+    @staticmethod
+    def is_healthy(driver: WebDriver) -> bool:
+        """
+        Checks that the browser behind the driver is still alive and answering commands.
+        """
+        try:
+            driver.execute_script('return 1;')
+            return bool(driver.window_handles)
+        except Exception:  # A dead chromedriver raises connection errors, not WebDriverException
+            return False
+
+    @staticmethod
+    def reset(driver: WebDriver) -> bool:
+        """
+        Brings the browser back to a neutral state: a single tab, no cookies, empty storage
+        and a blank page. Returns False if the browser could not be reset.
+        """
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.delete_all_cookies()
+            origin = driver.execute_script(
+                'try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}'
+                'return window.location.origin;'
+            )
+            if origin and origin != 'null':
+                # Firebase keeps the signed-in user in IndexedDB, which the calls above do not reach
+                driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+            driver.get('about:blank')
+            # Drop the network events buffered by chromedriver, which would otherwise grow for the whole session
+            driver.get_log('performance')
+            return True
+        except Exception as e:
+            logging.debug('Failed to reset pooled driver: %s', e)
+            return False
+
+    @staticmethod
+    def _quit(driver: WebDriver) -> None:
+        PROCESS_TRACKER.reap(driver)
+
+
+DRIVER_POOL = DriverPool()
+atexit.register(DRIVER_POOL.close)
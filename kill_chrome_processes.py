@@ -1,6 +1,15 @@
 """
-This script is used to kill all Google Chrome processes running on the system.
+This script is used to kill the Google Chrome processes left behind by the UI tests.
+
+By default it only reaps the chromedriver/Chrome process trees recorded by the test
+process tracker whose test process has exited. Pass --all to kill every Google Chrome
+process running on the system, as the script used to.
+
+Usage:
+    python -m tests.ux_tests.ui_tests.kill_chrome_processes
+    python kill_chrome_processes.py --all
 """
+import argparse
 import os
 import subprocess
 
@@ -15,4 +24,26 @@ def kill_chrome_processes():
         subprocess.call(["pkill", "-f", "chrome"])
 
 
-kill_chrome_processes()
+def main():
+    """
+    Reaps the recorded orphan Chrome processes, or every Chrome process with --all.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--all', action='store_true', help='Kill every Google Chrome process on the system')
+    parser.add_argument('--include-running', action='store_true',
+                        help='Also reap the recorded browsers of test processes that are still running')
+    parser.add_argument('--registry', help='The PID registry written by the tests, CHROME_PID_REGISTRY by default')
+    args = parser.parse_args()
+
+    if args.all:
+        kill_chrome_processes()
+    else:
+        # Imported here so that --all keeps working when the file is run as a plain script
+        from tests.ux_tests.ui_tests.common.process_tracker import REGISTRY_PATH, reap_orphans
+
+        reaped = reap_orphans(args.registry or REGISTRY_PATH, include_live_owners=args.include_running)
+        print(f"Reaped {reaped} recorded Chrome processes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+This module samples the memory of the browser behind a driver, around every test: the RSS
+of its whole process tree (chromedriver, browser, renderers, GPU...) and the JS heap of the
+page, through CDP Performance.getMetrics. The per-test deltas are written to a JSON lines
+report for leak hunting, and InternalTestBase recycles a pooled browser that grew past the
+configured limits instead of handing it to the next test.
+
+Usage:
+    MEMORY_REPORT=memory.jsonl MEMORY_RSS_LIMIT_MB=1500 DRIVER_POOL_SCOPE=class python -m pytest ...
+"""
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional
+
+import psutil
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from tests.file_lock import file_lock
+from tests.ux_tests.ui_tests.common.process_tracker import PROCESS_TRACKER
+
+MEMORY_REPORT_PATH: Optional[str] = os.environ.get('MEMORY_REPORT') or None
+
+MEGABYTE = 1024 * 1024
+
+
+def sample_memory(driver: WebDriver) -> Dict[str, Optional[float]]:
+    """
+    Returns the RSS of the process tree of the driver and the used JS heap of its page, in MB.
+    A value that could not be read is None.
+    """
+    rss = 0
+    processes = PROCESS_TRACKER.process_tree(driver)
+    for process in processes:
+        try:
+            rss += process.memory_info().rss
+        except psutil.Error:  # The process exited since the tree was listed
+            pass
+
+    js_heap = None
+    try:
+        driver.execute_cdp_cmd('Performance.enable', {})
+        metrics = driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+        js_heap = next((metric['value'] for metric in metrics if metric['name'] == 'JSHeapUsedSize'), None)
+    except Exception as e:  # A dead or busy browser must not fail the test
+        logging.debug('Could not read the JS heap metrics: %s', e)
+
+    return {
+        'rss_mb': rss / MEGABYTE if processes else None,
+        'js_heap_mb': js_heap / MEGABYTE if js_heap is not None else None,
+    }
+
+
+def exceeded_limits(sample: Dict[str, Optional[float]], rss_limit_mb: Optional[float],
+                    js_heap_limit_mb: Optional[float]) -> List[str]:
+    """
+    Returns the descriptions of the limits the sample exceeds, empty if none.
+    """
+    exceeded = []
+    if rss_limit_mb is not None and sample.get('rss_mb') is not None and sample['rss_mb'] > rss_limit_mb:
+        exceeded.append(f"RSS {sample['rss_mb']:.0f} MB > {rss_limit_mb:.0f} MB")
+    if js_heap_limit_mb is not None and sample.get('js_heap_mb') is not None \
+            and sample['js_heap_mb'] > js_heap_limit_mb:
+        exceeded.append(f"JS heap {sample['js_heap_mb']:.0f} MB > {js_heap_limit_mb:.0f} MB")
+    return exceeded
+
+
+class MemoryMonitor:
+    """
+    Samples the browser memory at the start and at the end of every test and reports the deltas.
+    """
+
+    def __init__(self, report_path: Optional[str] = MEMORY_REPORT_PATH):
+        """
+        :param report_path: The JSON lines file the per-test records are appended to, if any.
+        """
+        self.report_path: Optional[str] = report_path
+        self._baselines: Dict[str, Dict[str, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def start(self, test_id: str, driver: WebDriver) -> None:
+        """
+        Records the memory of the driver before the test runs.
+        """
+        sample = sample_memory(driver)
+        with self._lock:
+            self._baselines[test_id] = sample
+
+    def stop(self, test_id: str, driver: WebDriver) -> dict:
+        """
+        Samples the memory of the driver after the test and returns the test record: the
+        sample, and its deltas from the start of the test. The record is appended to the report.
+        """
+        sample = sample_memory(driver)
+        with self._lock:
+            baseline = self._baselines.pop(test_id, {})
+        record = dict(test=test_id, pid=os.getpid(), **sample)
+        for name, value in sample.items():
+            start_value = baseline.get(name)
+            record[f'{name[:-3]}_delta_mb'] = value - start_value \
+                if value is not None and start_value is not None else None
+
+        logging.info('Memory of %s: %s', test_id, record)
+        if self.report_path is not None:
+            with file_lock(f'{self.report_path}.lock'):
+                with open(self.report_path, 'a', encoding='utf-8') as report:
+                    report.write(json.dumps(record) + '\n')
+        return record
+
+
+MEMORY_MONITOR = MemoryMonitor()
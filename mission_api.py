@@ -3,52 +3,269 @@ This module provides an interface to interact with the Mission API,
 including domain-specific classes for Maps, Customers, and Missions.
 """
 
+import hashlib
 import json
+import logging
 import os
-from typing import Optional
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from tests.file_lock import file_lock
+from tests.tracing import bound_tracer, current_tracer
 
-class MissionAPI:
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+_session_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+
+
+def build_session(pool_size: int = 10, retries: int = 3, backoff: float = 0.3) -> requests.Session:
     """
-    Base class for interacting with the Mission API.
-    Provides methods for authentication and making HTTP requests.
+    Builds a requests session with a sized keep-alive connection pool that retries
+    idempotent requests on connection errors and 429/5xx responses, with exponential backoff.
+
+    :param pool_size: The maximum number of connections kept open per host.
+    :param retries: How many times a failed idempotent request is retried.
+    :param backoff: The backoff factor between retries, in seconds.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=IDEMPOTENT_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def http_session() -> requests.Session:
+    """
+    Returns the session shared by every MissionAPI instance of this process, configured by
+    MISSION_API_POOL_SIZE, MISSION_API_RETRIES and MISSION_API_BACKOFF.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = build_session(
+                pool_size=int(os.getenv("MISSION_API_POOL_SIZE", "10")),
+                retries=int(os.getenv("MISSION_API_RETRIES", "3")),
+                backoff=float(os.getenv("MISSION_API_BACKOFF", "0.3")),
+            )
+        return _session
+
+
+def firebase_sign_in() -> dict:
+    """
+    Signs in to Firebase with the test user credentials and returns the full response,
+    including the idToken, refreshToken, localId and expiresIn fields.
+    Raises a ValueError if authentication fails.
+    """
+    fb_token = os.getenv("FIREBASE_TOKEN")
+    auth_url = os.getenv("FIREBASE_AUTH_URL", "https://identitytoolkit.googleapis.com")
+    url = f"{auth_url}/v1/accounts:signInWithPassword?key={fb_token}"
+    headers = {"Content-Type": "application/json"}
+    body = {
+        "email": os.getenv("VALID_EMAIL"),
+        "password": os.getenv("VALID_PASSWORD"),
+        "returnSecureToken": True
+    }
+
+    response = http_session().post(url, headers=headers, data=json.dumps(body), timeout=10)
+
+    if response.status_code == 200:
+        return response.json()
+    raise ValueError(f"Error: {response.status_code}, {response.text}")
+
+
+def firebase_refresh(refresh_token: str) -> dict:
+    """
+    Exchanges a Firebase refresh token for a new ID token and returns the response in the
+    shape of a sign-in response (idToken, refreshToken, localId and expiresIn fields).
+    Raises a ValueError if the refresh fails.
+    """
+    fb_token = os.getenv("FIREBASE_TOKEN")
+    securetoken_url = os.getenv("FIREBASE_SECURETOKEN_URL", "https://securetoken.googleapis.com")
+    url = f"{securetoken_url}/v1/token?key={fb_token}"
+    body = {"grant_type": "refresh_token", "refresh_token": refresh_token}
+
+    response = http_session().post(url, data=body, timeout=10)
+
+    if response.status_code == 200:
+        res_json = response.json()
+        return {
+            "idToken": res_json["id_token"],
+            "refreshToken": res_json["refresh_token"],
+            "localId": res_json["user_id"],
+            "expiresIn": res_json["expires_in"],
+        }
+    raise ValueError(f"Error: {response.status_code}, {response.text}")
+
+
+class TokenProvider:
+    """
+    Provides the Firebase auth state of the test user to every MissionAPI instance and to the
+    browser token login. The state is cached in memory and in a locked file on disk, so that
+    the parallel worker processes share a single sign-in, and it is renewed with the refresh
+    token in the background before it expires.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, refresh_margin: float = 300):
+        """
+        :param cache_path: The on-disk cache file, by default MISSION_API_TOKEN_CACHE or a file
+            in the temp directory named after the user and API key.
+        :param refresh_margin: How many seconds before expiry the token is renewed.
+        """
+        if cache_path is None:
+            user_key = hashlib.sha256(
+                f"{os.getenv('VALID_EMAIL')}:{os.getenv('FIREBASE_TOKEN')}".encode()
+            ).hexdigest()[:16]
+            cache_path = os.getenv("MISSION_API_TOKEN_CACHE",
+                                   os.path.join(tempfile.gettempdir(), f"mission_api_token_{user_key}.json"))
+        self.cache_path: str = cache_path
+        self.refresh_margin: float = refresh_margin
+        self._auth: Optional[dict] = None
+        self._lock = threading.RLock()
+        self._refresh_timer: Optional[threading.Timer] = None
+
+    def auth(self) -> dict:
+        """
+        Returns the current auth state: the sign-in response fields plus expiresAt (epoch seconds).
+        """
+        with self._lock:
+            if not self._is_fresh(self._auth):
+                self._renew()
+            return self._auth
+
+    def token(self) -> str:
+        """
+        Returns a valid ID token.
+        """
+        return self.auth()["idToken"]
+
+    def invalidate(self, token: str) -> None:
+        """
+        Marks the token as rejected, so the next call renews it (unless another process already did).
+        """
+        with self._lock:
+            if self._auth is not None and self._auth["idToken"] == token:
+                self._auth = dict(self._auth, expiresAt=0)
+            with file_lock(f"{self.cache_path}.lock"):
+                cached = self._read_cache()
+                if cached is not None and cached["idToken"] == token:
+                    self._write_cache(dict(cached, expiresAt=0))
+
+    def _is_fresh(self, auth: Optional[dict]) -> bool:
+        return auth is not None and auth["expiresAt"] - self.refresh_margin > time.time()
+
+    def _renew(self) -> None:
+        with file_lock(f"{self.cache_path}.lock"):
+            cached = self._read_cache()
+            if self._is_fresh(cached):
+                auth = cached
+            else:
+                refresh_token = (cached or self._auth or {}).get("refreshToken")
+                response = None
+                if refresh_token:
+                    try:
+                        response = firebase_refresh(refresh_token)
+                    except (ValueError, requests.RequestException) as e:
+                        logging.warning("Token refresh failed, signing in again: %s", e)
+                if response is None:
+                    response = firebase_sign_in()
+                auth = dict(response, expiresAt=time.time() + int(response["expiresIn"]))
+                auth.setdefault("email", (cached or {}).get("email", os.getenv("VALID_EMAIL")))
+                self._write_cache(auth)
+        self._auth = auth
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        delay = max(self._auth["expiresAt"] - self.refresh_margin - time.time(), 0) + 1
+        self._refresh_timer = threading.Timer(delay, self._background_refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self.auth()
+        except (ValueError, requests.RequestException) as e:
+            logging.error("Background token refresh failed: %s", e)
+
+    def _read_cache(self) -> Optional[dict]:
+        try:
+            with open(self.cache_path, encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, auth: dict) -> None:
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w",
+                  encoding="utf-8") as cache_file:
+            json.dump(auth, cache_file)
+        os.replace(temp_path, self.cache_path)
+
+
+TOKEN_PROVIDER = TokenProvider()
+
+
+class BulkResult:
+    """
+    Holds the per-ID outcome of a bulk operation: the return value for the IDs that
+    succeeded and the exception for those that failed.
     """
 
     def __init__(self):
-        self.base_url: str = os.getenv('MISSION_API_URL')
-        self._token: Optional[str] = None
+        self.results: Dict[Hashable, Any] = {}
+        self.errors: Dict[Hashable, Exception] = {}
 
-    def __get_token(self):
+    @property
+    def ok(self) -> bool:
         """
-        Retrieves and sets the authentication token using Firebase credentials.
-        Raises a ValueError if authentication fails.
+        True if the operation succeeded for every ID.
         """
-        fb_token = os.getenv("FIREBASE_TOKEN")
-        url = f"https://identitytoolkit.googleapis.com/v1/accounts:signInWithPassword?key={fb_token}"
-        headers = {"Content-Type": "application/json"}
-        body = {
-            "email": os.getenv("VALID_EMAIL"),
-            "password": os.getenv("VALID_PASSWORD"),
-            "returnSecureToken": True
-        }
+        return not self.errors
 
-        response = requests.post(url, headers=headers, data=json.dumps(body), timeout=10)
+    def raise_for_failures(self) -> None:
+        """
+        Raises a ValueError listing every failed ID, if any failed.
+        """
+        if self.errors:
+            details = "; ".join(f"{item_id}: {error}" for item_id, error in self.errors.items())
+            raise ValueError(f"{len(self.errors)} of {len(self.results) + len(self.errors)} failed: {details}")
 
-        if response.status_code == 200:
-            res_json = response.json()
-            self._token = res_json["idToken"]
-        else:
-            raise ValueError(f"Error: {response.status_code}, {response.text}")
+
+class MissionAPI:
+    """
+    Base class for interacting with the Mission API.
+    Provides methods for authentication and making HTTP requests.
+    """
+
+    # Query parameters of the paginated list endpoints
+    page_param: str = "page"
+    page_size_param: str = "page_size"
+    first_page: int = 1
+
+    def __init__(self):
+        self.base_url: str = os.getenv('MISSION_API_URL')
 
     def token(self) -> str:
         """
-        Returns the authentication token. Retrieves a new token if not already set.
+        Returns the authentication token shared by all the MissionAPI instances.
         """
-        if self._token is None:
-            self.__get_token()
-        return self._token
+        return TOKEN_PROVIDER.token()
 
     def _get_headers(self) -> dict:
         """
@@ -60,17 +277,132 @@ class MissionAPI:
             "Authorization": f"Bearer {bearer_token}",
         }
 
+    @staticmethod
+    def run_bulk(operation: Callable[[Any], Any], ids: Iterable[Hashable],
+                 max_workers: Optional[int] = None) -> BulkResult:
+        """
+        Runs the operation for every ID on a bounded thread pool, collecting every result
+        and every failure instead of stopping at the first one.
+
+        :param operation: The single-ID operation, e.g. a delete method.
+        :param ids: The IDs to run the operation for.
+        :param max_workers: The maximum number of concurrent requests, MISSION_API_BULK_WORKERS by default.
+        """
+        ids = list(dict.fromkeys(ids))
+        result = BulkResult()
+        if not ids:
+            return result
+
+        max_workers = max_workers or int(os.getenv("MISSION_API_BULK_WORKERS", "8"))
+        # Record the requests of the pool threads in the tracer of the caller
+        tracer = current_tracer()
+
+        def traced_operation(item_id: Hashable) -> Any:
+            with bound_tracer(tracer):
+                return operation(item_id)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ids))) as executor:
+            futures = {item_id: executor.submit(traced_operation, item_id) for item_id in ids}
+            for item_id, future in futures.items():
+                try:
+                    result.results[item_id] = future.result()
+                except Exception as e:
+                    result.errors[item_id] = e
+        return result
+
+    def iter_pages(self, path: str, filters: Optional[dict] = None, page_size: int = 50) -> Iterator[dict]:
+        """
+        Lazily yields the items of a paginated list endpoint, one page in memory at a time.
+        The next page is fetched in the background while the current one is being consumed.
+        The iteration ends at the reported total when the response has one, otherwise at a short
+        page, and on an empty or repeated page, or a page larger than page_size (no pagination).
+
+        :param path: The path of the list endpoint, e.g. 'customer'.
+        :param filters: Query parameters narrowing the results, e.g. {'name': 'boris'}.
+        :param page_size: The number of items requested per page.
+        """
+        filters = dict(filters or {})
+
+        def fetch(page: int) -> Tuple[List[dict], Optional[int]]:
+            response = self._request("GET", path, params={**filters, self.page_param: page,
+                                                          self.page_size_param: page_size})
+            if not response.status_code == 200:
+                raise ValueError(f"Error: {response.status_code}, {response.text}")
+            return self._page_items(response.json())
+
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            page = self.first_page
+            future = prefetcher.submit(fetch, page)
+            seen = 0
+            previous_items: Optional[List[dict]] = None
+            while True:
+                items, total = future.result()
+                if not items or items == previous_items:
+                    # Past the end, or an endpoint ignoring the page parameter
+                    return
+                seen += len(items)
+                if len(items) > page_size:
+                    # The endpoint ignores page_size and returned everything at once
+                    is_last = True
+                elif total is not None:
+                    # The server may cap the page size, so trust the reported total over short pages
+                    is_last = seen >= total
+                else:
+                    is_last = len(items) < page_size
+                previous_items = items
+                if not is_last:
+                    future = prefetcher.submit(fetch, page + 1)
+                yield from items
+                if is_last:
+                    return
+                page += 1
+
+    @staticmethod
+    def _page_items(payload: Any) -> Tuple[List[dict], Optional[int]]:
+        """
+        Returns the items and the total count (if reported) of a list endpoint response,
+        which is either a bare list or an object wrapping the items.
+        """
+        if isinstance(payload, list):
+            return payload, None
+        items = next((payload[key] for key in ("items", "results", "data", "rows") if key in payload), [])
+        total = next((payload[key] for key in ("total", "count", "total_count") if key in payload), None)
+        return items, total
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """
+        Makes an authenticated request, renewing the token and retrying once if it was rejected.
+        """
+        with current_tracer().span("http", method=method, path=path) as span:
+            headers = self._get_headers()
+            started = time.perf_counter()
+            response = http_session().request(method, f"{self.base_url}/{path}", headers=headers, timeout=10,
+                                              **kwargs)
+            if response.status_code == 401:
+                TOKEN_PROVIDER.invalidate(headers["Authorization"].split(" ", 1)[1])
+                response = http_session().request(method, f"{self.base_url}/{path}", headers=self._get_headers(),
+                                                  timeout=10, **kwargs)
+            span["latency"] = time.perf_counter() - started
+            span["status"] = response.status_code
+        return response
+
     def http_delete(self, path: str) -> requests.Response:
         """
         Makes an HTTP DELETE request to the specified path.
         """
-        return requests.delete(f"{self.base_url}/{path}", headers=self._get_headers(), timeout=10)
+        return self._request("DELETE", path)
 
     def http_get(self, path: str) -> requests.Response:
         """
         Makes an HTTP GET request to the specified path.
         """
-        return requests.get(f"{self.base_url}/{path}", headers=self._get_headers(), timeout=10)
+        return self._request("GET", path)
+
+    def http_post(self, path: str, payload: dict) -> requests.Response:
+        """
+        Makes an HTTP POST request with a JSON payload to the specified path.
+        """
+        return self._request("POST", path, json=payload)
 
 
 class MissionAPIDomainMap(MissionAPI):
@@ -91,6 +423,27 @@ class MissionAPIDomainMap(MissionAPI):
             raise ValueError(f"Error: {response.status_code}, {response.text}")
         return True
 
+    def create_map(self, data: dict) -> dict:
+        """
+        Creates a map and returns it, including its ID.
+        """
+        response = self.http_post(self.base_url_domain, data)
+        if response.status_code not in (200, 201):
+            raise ValueError(f"Error: {response.status_code}, {response.text}")
+        return response.json()
+
+    def delete_maps(self, map_ids: Iterable[int]) -> BulkResult:
+        """
+        Deletes many maps concurrently and returns the per-ID results.
+        """
+        return self.run_bulk(self.delete_map, map_ids)
+
+    def iter_maps(self, filters: Optional[dict] = None, page_size: int = 50) -> Iterator[dict]:
+        """
+        Lazily yields the maps matching the filters, page by page.
+        """
+        return self.iter_pages(self.base_url_domain, filters, page_size)
+
     def get_map(self, map_id: int) -> dict:
         """
         Retrieves a map by its ID.
@@ -119,6 +472,27 @@ class MissionAPIDomainCustomer(MissionAPI):
             raise ValueError(f"Error: {response.status_code}, {response.text}")
         return True
 
+    def create_customer(self, data: dict) -> dict:
+        """
+        Creates a customer and returns it, including its ID.
+        """
+        response = self.http_post(self.base_url_domain, data)
+        if response.status_code not in (200, 201):
+            raise ValueError(f"Error: {response.status_code}, {response.text}")
+        return response.json()
+
+    def delete_customers(self, customer_ids: Iterable[str]) -> BulkResult:
+        """
+        Deletes many customers concurrently and returns the per-ID results.
+        """
+        return self.run_bulk(self.delete_customer, customer_ids)
+
+    def iter_customers(self, filters: Optional[dict] = None, page_size: int = 50) -> Iterator[dict]:
+        """
+        Lazily yields the customers matching the filters, page by page.
+        """
+        return self.iter_pages(self.base_url_domain, filters, page_size)
+
     def get_customer(self, customer_id: str) -> dict:
         """
         Retrieves a customer by their ID.
@@ -147,6 +521,27 @@ class MissionAPIDomainMission(MissionAPI):
             raise ValueError(f"Error: {response.status_code}, {response.text}")
         return True
 
+    def create_mission(self, data: dict) -> dict:
+        """
+        Creates a mission template and returns it, including its ID.
+        """
+        response = self.http_post(self.base_url_domain, data)
+        if response.status_code not in (200, 201):
+            raise ValueError(f"Error: {response.status_code}, {response.text}")
+        return response.json()
+
+    def delete_missions(self, mission_template_ids: Iterable[int]) -> BulkResult:
+        """
+        Deletes many mission templates concurrently and returns the per-ID results.
+        """
+        return self.run_bulk(self.delete_mission, mission_template_ids)
+
+    def iter_mission_templates(self, filters: Optional[dict] = None, page_size: int = 50) -> Iterator[dict]:
+        """
+        Lazily yields the mission templates matching the filters, page by page.
+        """
+        return self.iter_pages(self.base_url_domain, filters, page_size)
+
     def get_mission(self, mission_template_id: int) -> dict:
         """
         Retrieves a mission template by its ID.
@@ -0,0 +1,55 @@
+"""
+This module provides named network blocking profiles for the browser under test. A profile
+is a list of URL patterns (with '*' wildcards) that Chrome refuses to load, applied through
+CDP Network.setBlockedURLs, so pages skip the images, fonts, map tiles and third-party
+analytics the assertions never look at.
+"""
+import os
+from typing import Dict, List
+
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+ANALYTICS_URLS: List[str] = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*hotjar.com*',
+    '*segment.io*', '*mixpanel.com*', '*clarity.ms*', '*connect.facebook.net*',
+]
+FONT_URLS: List[str] = [
+    '*fonts.googleapis.com*', '*fonts.gstatic.com*', '*.woff', '*.woff2', '*.ttf', '*.otf',
+]
+IMAGE_URLS: List[str] = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.ico',
+]
+MAP_TILE_URLS: List[str] = [
+    '*tile.openstreetmap.org*', '*tiles.mapbox.com*', '*api.mapbox.com/v4/*', '*maps.googleapis.com/maps/vt*',
+    '*khms*.google.com*', '*arcgisonline.com*', '*.pbf',
+]
+
+NETWORK_PROFILES: Dict[str, List[str]] = {
+    # Load everything, as a browser without a profile does
+    'none': [],
+    # Only the app itself and its API
+    'minimal': ANALYTICS_URLS + FONT_URLS + IMAGE_URLS + MAP_TILE_URLS,
+    # Raster tiles are images, so this profile has to keep images for the map views to render
+    'maps-needs-tiles': ANALYTICS_URLS + FONT_URLS,
+}
+
+
+def blocked_urls(profile: str) -> List[str]:
+    """
+    Returns the URL patterns blocked by the profile, plus any comma-separated extra
+    patterns from NETWORK_BLOCKED_URLS.
+
+    :param profile: The name of a profile in NETWORK_PROFILES.
+    """
+    if profile not in NETWORK_PROFILES:
+        raise ValueError(f"Unknown network profile: {profile}, expected one of {tuple(NETWORK_PROFILES)}")
+    extra_urls = [url.strip() for url in os.environ.get('NETWORK_BLOCKED_URLS', '').split(',') if url.strip()]
+    return NETWORK_PROFILES[profile] + extra_urls
+
+
+def apply_network_profile(driver: WebDriver, profile: str) -> None:
+    """
+    Makes the browser block the URLs of the profile for all subsequent requests.
+    """
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_urls(profile)})
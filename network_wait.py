@@ -0,0 +1,105 @@
+"""
+This module provides a wait driven by the CDP Network events of the browser: it performs an
+action and blocks until the fetch/XHR requests it triggered have completed, optionally
+returning their response bodies. The events are read from the chromedriver performance log,
+which InternalTestBase enables on every driver.
+"""
+import base64
+import json
+import re
+import time
+from typing import Callable, Dict, Iterable, List, Pattern, Union
+
+from selenium.common import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+UrlPattern = Union[str, Pattern]
+
+API_REQUEST_TYPES = ('XHR', 'Fetch')
+
+
+def _matches(url: str, url_patterns: List[UrlPattern]) -> bool:
+    """
+    Plain strings match as substrings (e.g. '/customer?'), compiled regexes with search.
+    """
+    if not url_patterns:
+        return True
+    return any(pattern.search(url) if isinstance(pattern, re.Pattern) else pattern in url
+               for pattern in url_patterns)
+
+
+def drain_network_events(driver: WebDriver) -> None:
+    """
+    Discards the network events buffered so far.
+    """
+    driver.get_log('performance')
+
+
+def wait_for_requests(driver: WebDriver, action: Callable[[], None], url_patterns: Iterable[UrlPattern] = (),
+                      timeout: float = 10, quiet_period: float = 0.1, return_body: bool = False) -> List[dict]:
+    """
+    Performs the action and waits until the API requests it triggered have finished.
+
+    :param driver: The WebDriver the action runs in.
+    :param action: The action triggering the requests, e.g. clicking the filter button.
+    :param url_patterns: Only wait for the requests whose URL matches one of the patterns.
+        When given, at least one matching request must be seen.
+    :param timeout: The maximum time to wait, in seconds.
+    :param quiet_period: How long no new request must start before the wait ends.
+    :param return_body: Whether to fetch the body of every finished response.
+    :return: The finished requests, as dicts with url, method, status, failed and (optionally) body.
+    """
+    url_patterns = list(url_patterns)
+    drain_network_events(driver)
+    action()
+
+    pending: Dict[str, dict] = {}
+    finished: Dict[str, dict] = {}
+    deadline = time.monotonic() + timeout
+    last_activity = time.monotonic()
+    while True:
+        for entry in driver.get_log('performance'):
+            message = json.loads(entry['message'])['message']
+            method, params = message['method'], message.get('params', {})
+            request_id = params.get('requestId')
+            if method == 'Network.requestWillBeSent' and params.get('type') in API_REQUEST_TYPES \
+                    and _matches(params['request']['url'], url_patterns):
+                pending[request_id] = {'request_id': request_id, 'url': params['request']['url'],
+                                       'method': params['request']['method'], 'status': None, 'failed': False}
+            elif method == 'Network.responseReceived' and request_id in pending:
+                pending[request_id]['status'] = params['response']['status']
+            elif method in ('Network.loadingFinished', 'Network.loadingFailed') and request_id in pending:
+                finished[request_id] = pending.pop(request_id)
+                finished[request_id]['failed'] = method == 'Network.loadingFailed'
+            else:
+                continue
+            last_activity = time.monotonic()
+
+        now = time.monotonic()
+        if not pending and (finished or not url_patterns) and now - last_activity >= quiet_period:
+            break
+        if now >= deadline:
+            in_flight = [request['url'] for request in pending.values()]
+            raise TimeoutException(f"Network not idle after {timeout}s, in flight: {in_flight}, "
+                                   f"patterns: {url_patterns}")
+        time.sleep(0.05)
+
+    if return_body:
+        for request in finished.values():
+            request['body'] = None if request['failed'] else _response_body(driver, request['request_id'])
+    return list(finished.values())
+
+
+def _response_body(driver: WebDriver, request_id: str):
+    """
+    Returns the response body of a request, decoded from JSON when possible.
+    """
+    try:
+        response = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+    except WebDriverException:
+        return None
+    body = base64.b64decode(response['body']).decode() if response.get('base64Encoded') else response['body']
+    try:
+        return json.loads(body)
+    except ValueError:
+        return body
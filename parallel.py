@@ -0,0 +1,241 @@
+"""
+This module provides the parallel execution mode for the UI tests: per-worker Chrome
+isolation (debugging port, user-data-dir and display) and a process-pool runner that
+spreads the InternalTestBase test classes over the cores of the host, balanced by the
+durations recorded in earlier runs (see scheduler).
+
+Usage:
+    python -m tests.ux_tests.ui_tests.common.parallel -n 8 tests.ux_tests.ui_tests.test_costumers_view ...
+"""
+import argparse
+import atexit
+import io
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from tests.ux_tests.ui_tests.common.driver_pool import DRIVER_POOL
+from tests.ux_tests.ui_tests.common.prewarm import PREWARMER
+from tests.ux_tests.ui_tests.common.scheduler import DURATIONS_PATH, DurationHistory, schedule_lpt
+from tests.ux_tests.ui_tests.common.teardown_executor import TEARDOWN_EXECUTOR
+from tests.ux_tests.ui_tests.common.timeout_model import TIMEOUT_MODEL
+
+WORKER_ID_ENV = 'TEST_WORKER_ID'
+
+
+def worker_id() -> Optional[str]:
+    """
+    Returns the id of the current worker, or None when the tests are not running in parallel.
+    Workers started by the runner below and by pytest-xdist are both recognised.
+    """
+    return os.environ.get(WORKER_ID_ENV) or os.environ.get('PYTEST_XDIST_WORKER')
+
+
+class WorkerEnvironment:
+    """
+    Holds the resources that keep the Chrome instances of one worker process apart
+    from those of the other workers on the same host.
+    """
+
+    def __init__(self):
+        self._root_dir: Optional[str] = None
+        self._display: Optional[str] = None
+        self._xvfb: Optional[subprocess.Popen] = None
+
+    @property
+    def root_dir(self) -> str:
+        """
+        Returns the temporary directory holding the user-data-dirs of this worker.
+        """
+        if self._root_dir is None:
+            self._root_dir = tempfile.mkdtemp(prefix=f"chrome-worker-{worker_id() or 'main'}-")
+        return self._root_dir
+
+    def new_user_data_dir(self) -> str:
+        """
+        Creates an empty user-data-dir for a new Chrome instance of this worker.
+        """
+        return tempfile.mkdtemp(prefix='profile-', dir=self.root_dir)
+
+    @staticmethod
+    def debugging_port() -> Optional[int]:
+        """
+        Returns the remote debugging port pinned by CHROME_DEBUGGING_PORT, which only works while
+        a single browser is running on the host, or None to let Chrome pick a free port itself
+        (chromedriver reads it from DevToolsActivePort), so concurrent launches never collide.
+        """
+        pinned_port = os.environ.get('CHROME_DEBUGGING_PORT')
+        return int(pinned_port) if pinned_port else None
+
+    def display(self) -> Optional[str]:
+        """
+        Returns the X display the Chrome instances of this worker should use. When PARALLEL_XVFB
+        is set, each worker starts its own Xvfb server; otherwise the inherited DISPLAY is used.
+        """
+        if self._display is None and os.environ.get('PARALLEL_XVFB') and os.name != 'nt':
+            self._display = self.__start_xvfb()
+        return self._display or os.environ.get('DISPLAY')
+
+    def service_env(self) -> Dict[str, str]:
+        """
+        Returns the environment the chromedriver service (and therefore Chrome) is started with.
+        """
+        env = dict(os.environ)
+        display = self.display()
+        if display:
+            env['DISPLAY'] = display
+        return env
+
+    def close(self) -> None:
+        """
+        Stops the Xvfb server of this worker and deletes its user-data-dirs.
+        """
+        if self._xvfb is not None:
+            self._xvfb.terminate()
+            try:
+                self._xvfb.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._xvfb.kill()
+            self._xvfb, self._display = None, None
+        if self._root_dir is not None:
+            shutil.rmtree(self._root_dir, ignore_errors=True)
+            self._root_dir = None
+
+    def __start_xvfb(self) -> str:
+        read_fd, write_fd = os.pipe()
+        self._xvfb = subprocess.Popen(
+            ['Xvfb', '-displayfd', str(write_fd), '-screen', '0', '1920x1080x24', '-nolisten', 'tcp'],
+            pass_fds=(write_fd,), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        os.close(write_fd)
+        with os.fdopen(read_fd) as display_pipe:
+            display_number = display_pipe.readline().strip()
+        if not display_number:
+            raise RuntimeError('Xvfb did not report a display number')
+        logging.info('Worker %s uses Xvfb display :%s', worker_id(), display_number)
+        return f":{display_number}"
+
+
+WORKER = WorkerEnvironment()
+atexit.register(WORKER.close)
+
+
+def collect_test_ids(names: List[str]) -> List[str]:
+    """
+    Expands module, class or method names into the ids of the individual test methods.
+    """
+    def flatten(suite):
+        for test in suite:
+            if isinstance(test, unittest.TestSuite):
+                yield from flatten(test)
+            else:
+                yield test.id()
+
+    return list(flatten(unittest.defaultTestLoader.loadTestsFromNames(names)))
+
+
+class _TimingResult(unittest.TextTestResult):
+    """
+    Records the duration of every test, including its setUp and tearDown.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.durations: Dict[str, float] = {}
+        self._started: float = 0.0
+
+    def startTest(self, test):
+        self._started = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        self.durations[test.id()] = time.perf_counter() - self._started
+
+
+def _shutdown_worker(stream: io.StringIO) -> None:
+    """
+    Releases what the tests of a shard left behind in the worker process. The pool workers are
+    forked and leave with os._exit, so the atexit handlers of the modules never run in them.
+    """
+    for description, error in TEARDOWN_EXECUTOR.flush():
+        stream.write(f"Teardown job failed ({description}): {error}\n")
+    # Quit the browsers before deleting their user-data-dirs
+    for shutdown in (PREWARMER.discard, DRIVER_POOL.close, TIMEOUT_MODEL.save, WORKER.close):
+        try:
+            shutdown()
+        except Exception as e:
+            stream.write(f"Worker shutdown step {shutdown.__qualname__} failed: {e}\n")
+
+
+def _run_shard(index: int, test_ids: List[str]) -> dict:
+    os.environ[WORKER_ID_ENV] = str(index)
+    stream = io.StringIO()
+    started = time.perf_counter()
+    suite = unittest.defaultTestLoader.loadTestsFromNames(test_ids)
+    try:
+        result = unittest.TextTestRunner(stream=stream, verbosity=2, resultclass=_TimingResult).run(suite)
+    finally:
+        _shutdown_worker(stream)
+    return {
+        'worker': index,
+        'tests_run': result.testsRun,
+        'failures': [(test.id(), trace) for test, trace in result.failures],
+        'errors': [(test.id(), trace) for test, trace in result.errors],
+        'duration': time.perf_counter() - started,
+        'durations': result.durations,
+        'output': stream.getvalue(),
+    }
+
+
+def run_shards(shards: List[List[str]]) -> List[dict]:
+    """
+    Runs each shard in its own worker process and returns the per-worker results.
+    """
+    with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+        futures = [executor.submit(_run_shard, index, shard) for index, shard in enumerate(shards) if shard]
+        return [future.result() for future in futures]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point of the parallel runner.
+    """
+    parser = argparse.ArgumentParser(description='Run the UI tests in parallel worker processes.')
+    parser.add_argument('names', nargs='+', help='Test modules, classes or methods to run')
+    parser.add_argument('-n', '--workers', type=int, default=os.cpu_count() or 1, help='Number of worker processes')
+    parser.add_argument('--durations', default=DURATIONS_PATH, help='File of the recorded test durations')
+    parser.add_argument('--no-class-affinity', action='store_true',
+                        help='Schedule the test methods individually instead of whole classes')
+    args = parser.parse_args(argv)
+
+    history = DurationHistory(args.durations)
+    shards, predicted_loads = schedule_lpt(collect_test_ids(args.names), args.workers, history,
+                                           class_affinity=not args.no_class_affinity)
+    results = run_shards(shards)
+
+    failed = False
+    for result in results:
+        sys.stdout.write(result['output'])
+        print(f"Worker {result['worker']}: {result['tests_run']} tests in {result['duration']:.1f}s "
+              f"(predicted {predicted_loads[result['worker']]:.1f}s), "
+              f"{len(result['failures'])} failures, {len(result['errors'])} errors")
+        failed = failed or bool(result['failures'] or result['errors'])
+    if results:
+        print(f"Makespan: {max(result['duration'] for result in results):.1f}s "
+              f"(predicted {max(predicted_loads):.1f}s)")
+    history.update({test_id: duration for result in results for test_id, duration in result['durations'].items()})
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    # Run from the imported module, so the workers clean up the WORKER the tests use, not a __main__ copy
+    from tests.ux_tests.ui_tests.common import parallel
+    sys.exit(parallel.main())
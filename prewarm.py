@@ -0,0 +1,79 @@
+"""
+This module launches and logs in the browser of the next test on a background thread while
+the current test runs, so that setUp picks up a ready, authenticated driver instead of
+paying for Chrome startup and login in sequence.
+"""
+import atexit
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Hashable, Optional
+
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from tests.ux_tests.ui_tests.common.driver_pool import DriverPool
+from tests.ux_tests.ui_tests.common.process_tracker import PROCESS_TRACKER
+
+
+class DriverPrewarmer:
+    """
+    Keeps at most one driver warming up in the background, for a given key (the test class).
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='driver-prewarm')
+        self._lock = threading.Lock()
+        self._key: Optional[Hashable] = None
+        self._future: Optional[Future] = None
+
+    def submit(self, key: Hashable, launch: Callable[[], WebDriver]) -> None:
+        """
+        Starts launching a driver for the key in the background, unless one is already warming up.
+
+        :param key: The key the driver is prepared for; only a take with the same key gets it.
+        :param launch: A callable that launches and logs in a new driver.
+        """
+        with self._lock:
+            if self._future is None:
+                self._key = key
+                self._future = self._executor.submit(launch)
+
+    def take(self, key: Hashable) -> Optional[WebDriver]:
+        """
+        Returns the driver warmed up for the key, waiting for it if it is not ready yet, or None
+        if there is none. A driver warmed up for another key, or broken, is discarded.
+        """
+        with self._lock:
+            future, future_key = self._future, self._key
+            self._future, self._key = None, None
+        if future is None:
+            return None
+
+        try:
+            driver = future.result()
+        except Exception as e:
+            logging.warning('Pre-warming the next driver failed: %s', e)
+            return None
+        if future_key != key or not DriverPool.is_healthy(driver):
+            PROCESS_TRACKER.reap_async(driver)
+            return None
+        return driver
+
+    def discard(self) -> None:
+        """
+        Quits the driver warming up, if any.
+        """
+        with self._lock:
+            future = self._future
+            self._future, self._key = None, None
+        if future is None:
+            return
+        try:
+            driver = future.result()
+        except Exception:
+            return
+        PROCESS_TRACKER.reap(driver)
+
+
+PREWARMER = DriverPrewarmer()
+atexit.register(PREWARMER.discard)
@@ -0,0 +1,178 @@
+"""
+This module tracks the chromedriver and Chrome processes launched by the tests, so that
+teardown reaps exactly the process tree of its own driver instead of scanning the whole
+process table, and so that orphans left by a crashed run can be reaped by recorded PID.
+"""
+import json
+import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import psutil
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from tests.file_lock import file_lock
+
+REGISTRY_PATH: str = os.environ.get('CHROME_PID_REGISTRY',
+                                    os.path.join(tempfile.gettempdir(), 'selenium_chrome_pids.jsonl'))
+
+
+def _read_registry(registry_path: str) -> List[dict]:
+    try:
+        with open(registry_path, encoding='utf-8') as registry:
+            return [json.loads(line) for line in registry if line.strip()]
+    except OSError:
+        return []
+
+
+def _write_registry(registry_path: str, entries: List[dict]) -> None:
+    with open(registry_path, 'w', encoding='utf-8') as registry:
+        registry.writelines(json.dumps(entry) + '\n' for entry in entries)
+
+
+def _recorded_process(entry: dict):
+    """
+    Returns the live process of a registry entry, or None if it exited or its PID was reused.
+    """
+    try:
+        process = psutil.Process(entry['pid'])
+        return process if process.create_time() == entry['create_time'] else None
+    except psutil.Error:
+        return None
+
+
+def _terminate(processes: List[psutil.Process], timeout: float) -> None:
+    """
+    Terminates the processes, killing those still alive after the timeout.
+    """
+    for process in processes:
+        try:
+            process.terminate()
+        except psutil.Error:
+            pass
+    _, alive = psutil.wait_procs(processes, timeout=timeout)
+    for process in alive:
+        try:
+            process.kill()
+        except psutil.Error:
+            pass
+
+
+class ProcessTracker:
+    """
+    Records the process tree of every driver at launch and reaps only that tree at teardown.
+    """
+
+    def __init__(self, registry_path: str = REGISTRY_PATH):
+        self.registry_path: str = registry_path
+        self._trees: Dict[int, List[dict]] = {}
+        self._user_data_dirs: Dict[int, str] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chrome-reaper')
+
+    def track(self, driver: WebDriver, user_data_dir: Optional[str] = None) -> None:
+        """
+        Records the chromedriver service process of the driver and its child tree.
+
+        :param driver: The driver just launched.
+        :param user_data_dir: The profile directory created for the driver alone, deleted when it is reaped.
+        """
+        if user_data_dir is not None:
+            self._user_data_dirs[id(driver)] = user_data_dir
+        try:
+            root = psutil.Process(driver.service.process.pid)
+            processes = [root] + root.children(recursive=True)
+            entries = [{'pid': process.pid, 'create_time': process.create_time(), 'owner': os.getpid()}
+                       for process in processes]
+        except (AttributeError, psutil.Error) as e:
+            logging.warning('Could not record the chromedriver process tree: %s', e)
+            return
+
+        self._trees[id(driver)] = entries
+        with file_lock(f'{self.registry_path}.lock'):
+            with open(self.registry_path, 'a', encoding='utf-8') as registry:
+                registry.writelines(json.dumps(entry) + '\n' for entry in entries)
+
+    def process_tree(self, driver: WebDriver) -> List[psutil.Process]:
+        """
+        Returns the live processes of the driver: the recorded ones plus any child started since.
+        """
+        processes = {}
+        for entry in self._trees.get(id(driver), []):
+            process = _recorded_process(entry)
+            if process is not None:
+                processes[process.pid] = process
+                try:
+                    processes.update((child.pid, child) for child in process.children(recursive=True))
+                except psutil.Error:
+                    pass
+        return list(processes.values())
+
+    def reap(self, driver: WebDriver, timeout: float = 5) -> None:
+        """
+        Quits the driver, terminates whatever is left of its process tree and deletes its own
+        profile directory.
+        """
+        processes = self.process_tree(driver)
+        try:
+            driver.quit()
+        except Exception as e:  # The driver may already be gone
+            logging.debug('Failed to quit driver: %s', e)
+        _terminate([process for process in processes if process.is_running()], timeout)
+        self.forget(driver)
+        user_data_dir = self._user_data_dirs.pop(id(driver), None)
+        if user_data_dir is not None:
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+
+    def reap_async(self, driver: WebDriver, timeout: float = 5) -> Future:
+        """
+        Reaps the driver on a background thread, so the caller does not wait for Chrome to exit.
+        """
+        return self._executor.submit(self.reap, driver, timeout)
+
+    def forget(self, driver: WebDriver) -> None:
+        """
+        Removes the processes of the driver from the registry.
+        """
+        entries = self._trees.pop(id(driver), [])
+        if not entries:
+            return
+        pids = {entry['pid'] for entry in entries}
+        with file_lock(f'{self.registry_path}.lock'):
+            _write_registry(self.registry_path, [entry for entry in _read_registry(self.registry_path)
+                                                 if entry['pid'] not in pids])
+
+
+def reap_orphans(registry_path: str = REGISTRY_PATH, include_live_owners: bool = False,
+                 timeout: float = 5) -> int:
+    """
+    Terminates the recorded Chrome process trees whose owning test process has exited.
+
+    :param registry_path: The registry written by the process trackers.
+    :param include_live_owners: Also reap the trees of test processes that are still running.
+    :param timeout: How long to wait for the processes to exit before killing them.
+    :return: The number of processes terminated.
+    """
+    with file_lock(f'{registry_path}.lock'):
+        entries = _read_registry(registry_path)
+        keep, processes = [], {}
+        for entry in entries:
+            if not include_live_owners and psutil.pid_exists(entry['owner']) and entry['owner'] != os.getpid():
+                keep.append(entry)
+                continue
+            process = _recorded_process(entry)
+            if process is not None:
+                processes[process.pid] = process
+                try:
+                    processes.update((child.pid, child) for child in process.children(recursive=True))
+                except psutil.Error:
+                    pass
+        _write_registry(registry_path, keep)
+
+    _terminate(list(processes.values()), timeout)
+    return len(processes)
+
+
+PROCESS_TRACKER = ProcessTracker()
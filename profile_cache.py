@@ -0,0 +1,72 @@
+"""
+This module provides the pre-built Chrome profile template: a user-data-dir whose HTTP
+cache already holds the SPA bundle, fonts and the other assets of the login page. It is
+built once, by the first driver that needs it, and copied into the fresh user-data-dir of
+every new driver, so that the cold page loads of the login become cache hits.
+
+The template holds no auth state: it is built by loading the login page without signing in.
+Delete the template directory to rebuild it, e.g. after a deployment of the application.
+
+Usage:
+    CHROME_PROFILE_TEMPLATE=/tmp/chrome-template python -m pytest ...
+"""
+import os
+import shutil
+import time
+from typing import Callable, Optional
+
+from tests.file_lock import file_lock
+
+PROFILE_TEMPLATE_PATH: Optional[str] = os.environ.get('CHROME_PROFILE_TEMPLATE') or None
+
+_READY_MARKER = '.template-ready'
+
+# The files that belong to the running Chrome instance, which a copy must not carry over
+_INSTANCE_FILES = ('SingletonLock', 'SingletonSocket', 'SingletonCookie', 'lockfile', _READY_MARKER)
+
+
+class ProfileTemplate:
+    """
+    A Chrome user-data-dir built once and copied for every new driver.
+    """
+
+    def __init__(self, path: Optional[str] = PROFILE_TEMPLATE_PATH):
+        """
+        :param path: The template directory; None disables the template.
+        """
+        self.path: Optional[str] = os.path.abspath(path) if path else None
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def is_built(self) -> bool:
+        return self.enabled and os.path.exists(os.path.join(self.path, _READY_MARKER))
+
+    def ensure_built(self, build: Callable[[str], None]) -> None:
+        """
+        Builds the template unless it exists. Only one process builds it, the others wait for it.
+
+        :param build: A callable launching Chrome on the given user-data-dir, warming its cache
+            and quitting it.
+        """
+        if self.is_built():
+            return
+        with file_lock(f'{self.path}.lock'):
+            if self.is_built():
+                return
+            shutil.rmtree(self.path, ignore_errors=True)
+            os.makedirs(self.path)
+            build(self.path)
+            with open(os.path.join(self.path, _READY_MARKER), 'w', encoding='utf-8') as marker:
+                marker.write(str(time.time()))
+
+    def clone(self, destination: str) -> None:
+        """
+        Copies the template into the user-data-dir of a new driver.
+        """
+        shutil.copytree(self.path, destination, ignore=shutil.ignore_patterns(*_INSTANCE_FILES),
+                        dirs_exist_ok=True)
+
+
+PROFILE_TEMPLATE = ProfileTemplate()
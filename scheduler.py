@@ -0,0 +1,114 @@
+"""
+This module provides the duration-aware scheduler of the parallel runner: the duration of
+every test is recorded across runs, and the tests are assigned to the workers with the
+longest-processing-time rule (the longest remaining unit goes to the least loaded worker),
+keeping the tests of a class together by default so that a shared driver and its login
+stay on one worker.
+"""
+import heapq
+import json
+import logging
+import os
+import statistics
+import tempfile
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from tests.file_lock import file_lock
+
+DURATIONS_PATH: str = os.environ.get('TEST_DURATIONS',
+                                     os.path.join(tempfile.gettempdir(), 'ui_test_durations.json'))
+
+# Used for every test when no test has a recorded duration yet
+DEFAULT_TEST_DURATION: float = 30
+
+
+class DurationHistory:
+    """
+    Keeps the expected duration of every test id, as a moving average of the recorded runs.
+    """
+
+    def __init__(self, path: str = DURATIONS_PATH, smoothing: float = 0.5):
+        """
+        :param path: The JSON file holding the durations, shared by the runs.
+        :param smoothing: The weight of the latest run in the moving average.
+        """
+        self.path: str = path
+        self.smoothing: float = smoothing
+        self.durations: Dict[str, float] = self._read()
+
+    def expected(self, test_id: str) -> Optional[float]:
+        """
+        Returns the expected duration of the test in seconds, or None if it never ran.
+        """
+        return self.durations.get(test_id)
+
+    def default_duration(self) -> float:
+        """
+        Returns the duration assumed for the tests without history: the median of the known ones.
+        """
+        return statistics.median(self.durations.values()) if self.durations else DEFAULT_TEST_DURATION
+
+    def update(self, durations: Dict[str, float]) -> None:
+        """
+        Folds the durations of a run into the history file.
+        """
+        with file_lock(f'{self.path}.lock'):
+            history = self._read()
+            for test_id, duration in durations.items():
+                previous = history.get(test_id)
+                history[test_id] = duration if previous is None \
+                    else self.smoothing * duration + (1 - self.smoothing) * previous
+            with open(self.path, 'w', encoding='utf-8') as history_file:
+                json.dump(history, history_file, indent=1, sort_keys=True)
+        self.durations = history
+
+    def _read(self) -> Dict[str, float]:
+        try:
+            with open(self.path, encoding='utf-8') as history_file:
+                return json.load(history_file)
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            logging.warning('Ignoring the unreadable test durations %s: %s', self.path, e)
+            return {}
+
+
+def _units(test_ids: Iterable[str], class_affinity: bool) -> List[List[str]]:
+    """
+    Groups the tests into the units scheduled as a whole: their classes, or the single tests.
+    """
+    if not class_affinity:
+        return [[test_id] for test_id in test_ids]
+    classes: Dict[str, List[str]] = {}
+    for test_id in test_ids:
+        classes.setdefault(test_id.rsplit('.', 1)[0], []).append(test_id)
+    return list(classes.values())
+
+
+def schedule_lpt(test_ids: List[str], workers: int, history: DurationHistory,
+                 class_affinity: bool = True) -> Tuple[List[List[str]], List[float]]:
+    """
+    Assigns the tests to the workers with the longest-processing-time rule.
+
+    :param test_ids: The ids of the test methods to run.
+    :param workers: The number of worker processes.
+    :param history: The recorded test durations.
+    :param class_affinity: Keep the tests of a class on the same worker.
+    :return: The tests of each worker, and the predicted duration of each worker.
+    """
+    default_duration = history.default_duration()
+
+    def unit_duration(unit: List[str]) -> float:
+        return sum(history.expected(test_id) or default_duration for test_id in unit)
+
+    units = sorted(_units(test_ids, class_affinity), key=unit_duration, reverse=True)
+    shard_count = min(workers, len(units)) or 1
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+    loads: List[float] = [0.0] * shard_count
+    heap: List[Tuple[float, int]] = [(0.0, index) for index in range(shard_count)]
+    for unit in units:
+        load, index = heapq.heappop(heap)
+        shards[index].extend(unit)
+        loads[index] = load + unit_duration(unit)
+        heapq.heappush(heap, (loads[index], index))
+    return shards, loads
@@ -0,0 +1,102 @@
+"""
+This module provides the settle engine used after interacting with an element: instead of
+sleeping for a fixed time, it waits until the page is quiet, i.e. no fetch/XHR request is
+in flight and the DOM has not changed for a short quiet period.
+"""
+import logging
+import os
+import time
+
+from selenium.common import JavascriptException, TimeoutException, WebDriverException
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+DEFAULT_QUIET_MS: int = int(os.environ.get('SETTLE_QUIET_MS', '100'))
+DEFAULT_SETTLE_TIMEOUT: float = float(os.environ.get('SETTLE_TIMEOUT', '5'))
+
+# Counts pending fetch/XHR requests and records the time of the last DOM mutation or request
+# transition. Installed on every new document through CDP, and lazily on pages that miss it.
+SETTLE_HOOKS_JS = """
+(function () {
+    if (window.__settle) { return; }
+    const state = window.__settle = {pending: 0, lastActivity: performance.now()};
+    const touch = () => { state.lastActivity = performance.now(); };
+    new MutationObserver(touch).observe(document, {
+        subtree: true, childList: true, attributes: true, characterData: true
+    });
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function () {
+            state.pending++;
+            touch();
+            return originalFetch.apply(this, arguments).finally(() => { state.pending--; touch(); });
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.pending++;
+        touch();
+        this.addEventListener('loadend', () => { state.pending--; touch(); }, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+})();
+"""
+
+# Resolves once the page has been quiet for quietMs, checking on every animation frame.
+WAIT_FOR_SETTLE_JS = """
+const [quietMs, timeoutMs, done] = arguments;
+const state = window.__settle;
+if (!state) { done(null); return; }
+const nextFrame = document.hidden ? (callback) => setTimeout(callback, 16) : requestAnimationFrame;
+const started = performance.now();
+const tick = () => {
+    const now = performance.now();
+    if (state.pending === 0 && now - state.lastActivity >= quietMs) {
+        done({settled: true, pending: 0, waited: now - started});
+    } else if (now - started >= timeoutMs) {
+        done({settled: false, pending: state.pending, waited: now - started});
+    } else {
+        nextFrame(tick);
+    }
+};
+nextFrame(tick);
+"""
+
+
+def install_settle_hooks(driver: WebDriver) -> None:
+    """
+    Registers the settle hooks so they run before any script of every new document.
+    """
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': SETTLE_HOOKS_JS})
+
+
+def wait_for_settle(driver: WebDriver, quiet_ms: int = DEFAULT_QUIET_MS,
+                    timeout: float = DEFAULT_SETTLE_TIMEOUT) -> bool:
+    """
+    Waits until the page has no pending requests and no DOM mutations for quiet_ms.
+
+    :param driver: The WebDriver of the page to wait on.
+    :param quiet_ms: How long the page must stay quiet to be considered settled.
+    :param timeout: The maximum time to wait, in seconds.
+    :return: True if the page settled, False if the timeout expired first.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining_ms = (deadline - time.monotonic()) * 1000
+        if remaining_ms <= 0:
+            return False
+        try:
+            result = driver.execute_async_script(WAIT_FOR_SETTLE_JS, quiet_ms, remaining_ms)
+        except (JavascriptException, TimeoutException):
+            # The document was replaced by a navigation while waiting; wait on the new one
+            continue
+        except WebDriverException as e:
+            logging.debug('Settle wait failed: %s', e)
+            return False
+
+        if result is None:
+            driver.execute_script(SETTLE_HOOKS_JS)
+            continue
+        if not result['settled']:
+            logging.debug('Page did not settle after %.0f ms, %s requests pending',
+                          result['waited'], result['pending'])
+        return result['settled']
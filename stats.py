@@ -0,0 +1,16 @@
+"""
+This module provides the small statistics helpers shared by the benchmark harness and the
+adaptive wait timeouts.
+"""
+from typing import List
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Returns the q-th percentile (0-100) of the values, interpolating between samples.
+    """
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
@@ -0,0 +1,47 @@
+"""
+This module provides the fail-fast step chain of InternalTestBase: once a step of the chain
+fails, the following steps are skipped immediately instead of each sitting through its own
+timeout, and the chain reports the failing locator and the wait time it skipped.
+"""
+from typing import List, Optional, Tuple
+
+
+class StepChain:
+    """
+    Tracks the first failed step of a sequence of find_and_operate_on_element calls.
+    """
+
+    def __init__(self):
+        self.failed_locator: Optional[Tuple[str, str]] = None
+        self.failed_operation: Optional[str] = None
+        self.error: Optional[str] = None
+        self.skipped: List[Tuple[str, str]] = []
+        self.skipped_budget: float = 0.0
+
+    @property
+    def failed(self) -> bool:
+        return self.failed_locator is not None
+
+    def record_failure(self, locator_tuple: Tuple[str, str], operation: str, error: str) -> None:
+        """
+        Marks the chain as failed by the step, unless an earlier step already failed it.
+        """
+        if not self.failed:
+            self.failed_locator, self.failed_operation, self.error = tuple(locator_tuple), operation, error
+
+    def skip(self, locator_tuple: Tuple[str, str], budget: float) -> None:
+        """
+        Records a step skipped because the chain already failed.
+
+        :param locator_tuple: The locator of the skipped step.
+        :param budget: The worst-case time the step would have waited, in seconds.
+        """
+        self.skipped.append(tuple(locator_tuple))
+        self.skipped_budget += budget
+
+    def report(self) -> str:
+        """
+        Describes the failed step and the steps skipped after it.
+        """
+        return (f"Step failed on {self.failed_locator} ({self.failed_operation}): {self.error}; "
+                f"skipped {len(self.skipped)} later steps, saving up to {self.skipped_budget:.0f}s of waits")
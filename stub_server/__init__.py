@@ -0,0 +1,14 @@
+"""
+Local stand-in for the web application and the Mission API, used to benchmark and profile
+the test harness (InternalTestBase, MissionAPI) under controlled latency without network.
+
+Usage:
+    python -m tests.stub_server --port 8080 --latency-ms 50
+
+    with StubServer(latency=0.05) as server:
+        os.environ['LOGIN_URL'] = server.url
+        ...
+"""
+from .server import StubServer, StubStore
+
+__all__ = ['StubServer', 'StubStore']
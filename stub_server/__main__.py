@@ -0,0 +1,35 @@
+"""
+Command line entry point of the stub server.
+"""
+import argparse
+
+from .server import StubServer
+
+
+def main() -> None:
+    """
+    Serves the stub app until interrupted and prints the environment to point the tests at it.
+    """
+    parser = argparse.ArgumentParser(description='Serve the local stand-in web app and Mission API.')
+    parser.add_argument('--host', default='127.0.0.1', help='The interface to listen on')
+    parser.add_argument('--port', type=int, default=8080, help='The port to listen on')
+    parser.add_argument('--latency-ms', type=float, default=0, help='Delay added to every response')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='Maximum random delay added on top')
+    parser.add_argument('--empty', action='store_true', help='Start without the seeded entities')
+    args = parser.parse_args()
+
+    server = StubServer(args.host, args.port, args.latency_ms / 1000, args.jitter_ms / 1000, seed=not args.empty)
+    print(f"LOGIN_URL={server.url}")
+    print(f"MISSION_API_URL={server.api_url}")
+    print(f"FIREBASE_AUTH_URL={server.url}")
+    print(f"FIREBASE_SECURETOKEN_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
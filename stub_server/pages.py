@@ -0,0 +1,230 @@
+"""
+This module holds the single page UI of the stub server. It reproduces only what the UI
+tests touch: the login form, the side and upper menus, the Highlights heading, the filter
+form with its MUI table and pagination text, the customer card, map creation and the
+user profile. All data goes through the stub Mission API with fetch, like the real app.
+"""
+
+INDEX_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Stub app</title>
+<style>
+  body { font-family: sans-serif; margin: 0; display: flex; }
+  nav { width: 180px; min-height: 100vh; background: #eee; }
+  nav button { display: block; width: 100%; padding: 8px; text-align: left; }
+  main { flex: 1; padding: 16px; }
+  header { display: flex; gap: 8px; margin-bottom: 16px; }
+  tr { cursor: pointer; }
+  .info-card-container { max-height: 200px; overflow-y: auto; border: 1px solid #ccc; padding: 8px; }
+  .info-card-container label { display: block; margin: 8px 0; }
+</style>
+</head>
+<body>
+<div id="root"></div>
+<script>
+const AUTH_PREFIX = 'firebase:authUser:';
+const state = {page: 'highlights', customer: null, currentCustomer: null};
+const root = document.getElementById('root');
+
+function authUser() {
+    const key = Object.keys(localStorage).find((k) => k.startsWith(AUTH_PREFIX));
+    return key ? JSON.parse(localStorage.getItem(key)) : null;
+}
+
+async function api(method, path, body) {
+    const user = authUser();
+    const response = await fetch('/api/' + path, {
+        method,
+        headers: {'Content-Type': 'application/json', 'Authorization': 'Bearer ' + user.stsTokenManager.accessToken},
+        body: body === undefined ? undefined : JSON.stringify(body),
+    });
+    return response.status === 204 ? null : response.json();
+}
+
+function escape(text) {
+    const span = document.createElement('span');
+    span.textContent = text == null ? '' : String(text);
+    return span.innerHTML;
+}
+
+function renderLogin() {
+    root.innerHTML = `
+      <main>
+        <form id="login-form">
+          <input id="email" type="email" placeholder="Email">
+          <input id="password" type="password" placeholder="Password">
+          <button type="submit">Sign in</button>
+        </form>
+      </main>`;
+    document.getElementById('login-form').addEventListener('submit', async (event) => {
+        event.preventDefault();
+        const response = await fetch('/v1/accounts:signInWithPassword?key=stub', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({
+                email: document.getElementById('email').value,
+                password: document.getElementById('password').value,
+                returnSecureToken: true,
+            }),
+        });
+        const auth = await response.json();
+        localStorage.setItem(AUTH_PREFIX + 'stub:[DEFAULT]', JSON.stringify({
+            uid: auth.localId, email: auth.email,
+            stsTokenManager: {accessToken: auth.idToken, refreshToken: auth.refreshToken},
+        }));
+        render();
+    });
+}
+
+function renderShell(content) {
+    const menu = ['highlights', 'missions', 'maps', 'customers', 'recognition', 'download', 'admin-settings'];
+    root.innerHTML = `
+      <nav>
+        <span class="MuiTypography-root MuiTypography-body1 MuiListItemText-primary css-ug2eej">${
+            escape(state.currentCustomer || '')}</span>
+        ${menu.map((id) => `<button id="${id}">${id}</button>`).join('')}
+      </nav>
+      <main>
+        <header>
+          <button id="header-profile-button">Profile</button>
+          <button id="notifications-button">Notifications</button>
+          <button title="Full screen">Full screen</button>
+          <div id="profile-menu" hidden><button id="header-profile">My profile</button></div>
+        </header>
+        <div id="content">${content}</div>
+      </main>`;
+    menu.forEach((id) => document.getElementById(id).addEventListener('click', () => {
+        state.page = id;
+        render();
+    }));
+    document.getElementById('header-profile-button').addEventListener('click', () => {
+        document.getElementById('profile-menu').hidden = false;
+    });
+    document.getElementById('header-profile').addEventListener('click', () => {
+        state.page = 'profile';
+        render();
+    });
+}
+
+function filterForm(fields) {
+    return `
+      <form id="filter-form">
+        ${fields.map((field) => `<input id="${field}" placeholder="${field}">`).join('')}
+        <button id="submit-filter" type="submit">Filter</button>
+      </form>
+      <table>
+        <thead><tr id="table-head"></tr></thead>
+        <tbody id="table-body"></tbody>
+      </table>
+      <p class="MuiTablePagination-displayedRows css-1chpzqh"></p>`;
+}
+
+async function loadTable(collection, fields, columns, onRowClick) {
+    const params = new URLSearchParams({page: 1, page_size: 10});
+    fields.forEach((field) => {
+        const value = document.getElementById(field).value;
+        if (value) { params.set(field, value); }
+    });
+    const result = await api('GET', collection + '?' + params);
+    document.getElementById('table-head').innerHTML = columns.map((column) => `<th>${column}</th>`).join('');
+    document.getElementById('table-body').innerHTML = result.items.map((item) => `
+      <tr id="${escape(item.id)}">${columns.map((column) => `<td>${escape(item[column])}</td>`).join('')}</tr>`
+    ).join('');
+    const shown = result.items.length;
+    document.querySelector('.MuiTablePagination-displayedRows').textContent =
+        `${shown ? 1 : 0}–${shown} of ${result.total}`;
+    result.items.forEach((item) => {
+        document.getElementById(String(item.id)).addEventListener('click', () => onRowClick(item));
+    });
+}
+
+function bindTable(collection, fields, columns, onRowClick) {
+    document.getElementById('filter-form').addEventListener('submit', (event) => {
+        event.preventDefault();
+        loadTable(collection, fields, columns, onRowClick);
+    });
+    loadTable(collection, fields, columns, onRowClick);
+}
+
+const CUSTOMER_FIELDS = ['name', 'country', 'city', 'address', 'default_email', 'phone', 'zip_code'];
+
+function renderCustomers() {
+    const customer = state.customer;
+    const card = customer === null ? '' : `
+      <div class="info-card-container">
+        ${CUSTOMER_FIELDS.map((field) => `
+          <label>${field}<input id="customer-card-${field}" value="${escape(customer[field] || '')}"></label>`
+        ).join('')}
+        <button id="save-customer-button">Save</button>
+        <button id="switch-customer-button">Switch to customer</button>
+      </div>`;
+    renderShell(`<button id="add_new_customer">Add customer</button>${card}` + filterForm(['name', 'country']));
+    const openCard = (item) => { state.customer = item; renderCustomers(); };
+    bindTable('customer', ['name', 'country'], ['name', 'country', 'city', 'default_email'], openCard);
+    document.getElementById('add_new_customer').addEventListener('click', () => openCard({}));
+    if (customer === null) { return; }
+    document.getElementById('save-customer-button').addEventListener('click', async () => {
+        const data = {};
+        CUSTOMER_FIELDS.forEach((field) => { data[field] = document.getElementById('customer-card-' + field).value; });
+        state.customer = customer.id ? await api('PUT', 'customer/' + customer.id, data) : await api('POST', 'customer', data);
+    });
+    document.getElementById('switch-customer-button').addEventListener('click', () => {
+        state.currentCustomer = customer.name;
+        state.customer = null;
+        renderCustomers();
+    });
+}
+
+function renderMaps() {
+    renderShell(`
+      <button id="create">Create map</button>
+      <div id="create-map" hidden>
+        <input id="create-map-name" placeholder="Map name"><button id="save-map">Save</button>
+      </div>` + filterForm(['name']));
+    bindTable('maps', ['name'], ['name'], () => {});
+    document.getElementById('create').addEventListener('click', () => {
+        document.getElementById('create-map').hidden = false;
+    });
+    document.getElementById('save-map').addEventListener('click', async () => {
+        await api('POST', 'maps', {name: document.getElementById('create-map-name').value});
+        document.getElementById('create-map').hidden = true;
+    });
+}
+
+function renderMissions() {
+    renderShell(filterForm(['name']) + '<button id="pagination-next-button">Next</button>');
+    bindTable('mission_templates', ['name'], ['name', 'description'], () => {});
+}
+
+function renderProfile() {
+    const user = authUser();
+    renderShell(`
+      <button id="user-edit">Edit</button>
+      <input id=":r0:" value="${escape(user.displayName || '')}">
+      <input id=":r1:" value="${escape(user.jobTitle || '')}">
+      <button id="user-save">Save</button>`);
+    document.getElementById('user-save').addEventListener('click', () => {
+        const key = Object.keys(localStorage).find((k) => k.startsWith(AUTH_PREFIX));
+        localStorage.setItem(key, JSON.stringify(Object.assign(user, {
+            displayName: document.getElementById(':r0:').value,
+            jobTitle: document.getElementById(':r1:').value,
+        })));
+    });
+}
+
+function render() {
+    if (!authUser()) { renderLogin(); return; }
+    if (state.page === 'customers') { renderCustomers(); return; }
+    if (state.page === 'maps') { renderMaps(); return; }
+    if (state.page === 'missions') { renderMissions(); return; }
+    if (state.page === 'profile') { renderProfile(); return; }
+    renderShell('<h5 class="MuiTypography-root MuiTypography-h5">Highlights</h5>');
+}
+
+render();
+</script>
+</body>
+</html>
+"""
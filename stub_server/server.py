@@ -0,0 +1,289 @@
+"""
+This module provides the HTTP server of the local stand-in: it serves the single page UI,
+the customer, maps and mission_templates endpoints of the Mission API, and a fake Firebase
+sign-in, all from an in-memory store and with a configurable artificial latency.
+"""
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .pages import INDEX_HTML
+
+TOKEN_LIFETIME = 3600
+
+SEED_CUSTOMERS = [
+    {'id': '91c95f6c-cbf7-4115-a79d-d67c1fea0dfd', 'name': 'Boristests', 'country': 'Israel', 'city': 'Haifa',
+     'address': '1 Test Street', 'default_email': 'boris@example.com', 'phone': '050-0000000',
+     'zip_code': '3100000'},
+    {'id': '2393ad37-2c8d-41a2-808f-1587a18dbb29', 'name': 'Befree Agro', 'country': 'Israel',
+     'city': 'Tel Aviv', 'address': '2 Test Street', 'default_email': 'befree@example.com',
+     'phone': '050-1111111', 'zip_code': '6100000'},
+]
+SEED_MAPS = [{'id': 1, 'name': 'test1'}, {'id': 2, 'name': 'test1 north field'}]
+SEED_MISSION_TEMPLATES = [{'id': 7146, 'name': 'Follow line survey', 'description': 'Seeded template',
+                           'task_type': 12}]
+
+
+class StubStore:
+    """
+    Holds the entities served by the stub API, per collection, keyed by ID.
+    """
+
+    def __init__(self, seed: bool = True):
+        self._lock = threading.Lock()
+        self._next_int_id = 10000
+        self.collections: Dict[str, Dict[str, dict]] = {'customer': {}, 'maps': {}, 'mission_templates': {}}
+        if seed:
+            for collection, entities in (('customer', SEED_CUSTOMERS), ('maps', SEED_MAPS),
+                                         ('mission_templates', SEED_MISSION_TEMPLATES)):
+                for entity in entities:
+                    self.collections[collection][str(entity['id'])] = dict(entity)
+
+    def create(self, collection: str, data: dict) -> dict:
+        """
+        Stores a new entity, with a UUID for customers and an integer ID otherwise.
+        """
+        with self._lock:
+            if collection == 'customer':
+                entity_id = str(uuid.uuid4())
+            else:
+                self._next_int_id += 1
+                entity_id = self._next_int_id
+            entity = dict(data, id=entity_id)
+            self.collections[collection][str(entity_id)] = entity
+            return entity
+
+    def update(self, collection: str, entity_id: str, data: dict) -> Optional[dict]:
+        """
+        Updates the fields of an entity, returning None if it does not exist.
+        """
+        with self._lock:
+            entity = self.collections[collection].get(entity_id)
+            if entity is not None:
+                entity.update({key: value for key, value in data.items() if key != 'id'})
+            return entity
+
+    def delete(self, collection: str, entity_id: str) -> bool:
+        """
+        Deletes an entity, returning False if it does not exist.
+        """
+        with self._lock:
+            return self.collections[collection].pop(entity_id, None) is not None
+
+    def query(self, collection: str, filters: Dict[str, str], page: int, page_size: int) -> Tuple[list, int]:
+        """
+        Returns one page of the entities whose fields contain the filter values (case-insensitive),
+        and the total number of matches.
+        """
+        with self._lock:
+            matches = [entity for entity in self.collections[collection].values()
+                       if all(value.lower() in str(entity.get(key, '')).lower() for key, value in filters.items())]
+        start = (page - 1) * page_size
+        return matches[start:start + page_size], len(matches)
+
+
+class StubServer:
+    """
+    Runs the stand-in web app and Mission API on a background thread.
+
+    Point the tests at it with LOGIN_URL=server.url, MISSION_API_URL=server.api_url and
+    FIREBASE_AUTH_URL=FIREBASE_SECURETOKEN_URL=server.url.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 seed: bool = True):
+        """
+        :param host: The interface to listen on.
+        :param port: The port to listen on, 0 for any free port.
+        :param latency: The artificial delay added to every response, in seconds.
+        :param jitter: The maximum random delay added on top of the latency, in seconds.
+        :param seed: Whether to start with the entities the UI tests expect to exist.
+        """
+        self.latency: float = latency
+        self.jitter: float = jitter
+        self.store = StubStore(seed=seed)
+        self.tokens: Dict[str, float] = {}
+        self.request_count: int = 0
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """
+        The base URL of the UI and of the fake Firebase endpoints.
+        """
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def api_url(self) -> str:
+        """
+        The base URL of the Mission API endpoints.
+        """
+        return f'{self.url}/api'
+
+    def start(self) -> 'StubServer':
+        """
+        Starts serving on a background thread.
+        """
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='stub-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """
+        Serves on the calling thread until interrupted.
+        """
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """
+        Stops serving and closes the listening socket.
+        """
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def issue_token(self) -> dict:
+        """
+        Issues a new ID token and refresh token in the shape of a Firebase sign-in response.
+        """
+        id_token = uuid.uuid4().hex
+        self.tokens[id_token] = time.time() + TOKEN_LIFETIME
+        return {'idToken': id_token, 'refreshToken': uuid.uuid4().hex, 'localId': 'stub-user',
+                'expiresIn': str(TOKEN_LIFETIME)}
+
+    def is_authorized(self, authorization: Optional[str]) -> bool:
+        """
+        Checks the Bearer token of an API request.
+        """
+        token = (authorization or '').partition('Bearer ')[2]
+        return self.tokens.get(token, 0) > time.time()
+
+    def delay(self) -> None:
+        """
+        Sleeps for the configured latency.
+        """
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+
+API_PATH = re.compile(r'^/api/(customer|maps|mission_templates)(?:/([^/]+))?/?$')
+
+# The real API answers deletes of mission templates with 200 and the others with 204
+DELETE_STATUS = {'customer': 204, 'maps': 204, 'mission_templates': 200}
+
+
+def _make_handler(server: StubServer):
+    class StubRequestHandler(BaseHTTPRequestHandler):
+        """
+        Routes the requests of the stub server.
+        """
+        protocol_version = 'HTTP/1.1'
+        # Headers and body are written separately; with Nagle on, keep-alive responses stall for 40 ms
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            self._handle('GET')
+
+        def do_POST(self):
+            self._handle('POST')
+
+        def do_PUT(self):
+            self._handle('PUT')
+
+        def do_DELETE(self):
+            self._handle('DELETE')
+
+        def do_OPTIONS(self):
+            self._send(204, b'')
+
+        def _handle(self, method: str) -> None:
+            server.request_count += 1
+            server.delay()
+            url = urlparse(self.path)
+            length = int(self.headers.get('Content-Length') or 0)
+            body = self.rfile.read(length) if length else b''
+
+            if url.path == '/v1/accounts:signInWithPassword' and method == 'POST':
+                credentials = json.loads(body or b'{}')
+                self._send_json(200, dict(server.issue_token(), email=credentials.get('email', 'stub@example.com')))
+            elif url.path == '/v1/token' and method == 'POST':
+                token = server.issue_token()
+                self._send_json(200, {'id_token': token['idToken'], 'refresh_token': token['refreshToken'],
+                                      'user_id': token['localId'], 'expires_in': token['expiresIn']})
+            elif url.path.startswith('/api/'):
+                self._handle_api(method, url, body)
+            elif method == 'GET':
+                self._send(200, INDEX_HTML.encode(), 'text/html; charset=utf-8')
+            else:
+                self._send_json(404, {'detail': 'Not found'})
+
+        def _handle_api(self, method: str, url, body: bytes) -> None:
+            match = API_PATH.match(url.path)
+            if match is None:
+                self._send_json(404, {'detail': 'Not found'})
+                return
+            if not server.is_authorized(self.headers.get('Authorization')):
+                self._send_json(401, {'detail': 'Unauthorized'})
+                return
+
+            collection, entity_id = match.groups()
+            if entity_id is None and method == 'GET':
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                page = int(params.pop('page', 1))
+                page_size = int(params.pop('page_size', 10))
+                items, total = server.store.query(collection, params, page, page_size)
+                self._send_json(200, {'items': items, 'total': total})
+            elif entity_id is None and method == 'POST':
+                self._send_json(201, server.store.create(collection, json.loads(body or b'{}')))
+            elif entity_id is None:
+                self._send_json(405, {'detail': 'Method not allowed'})
+            elif method == 'GET':
+                self._send_entity(server.store.collections[collection].get(entity_id))
+            elif method == 'PUT':
+                self._send_entity(server.store.update(collection, entity_id, json.loads(body or b'{}')))
+            elif method == 'DELETE':
+                if server.store.delete(collection, entity_id):
+                    self._send(DELETE_STATUS[collection], b'')
+                else:
+                    self._send_json(404, {'detail': 'Not found'})
+            else:
+                self._send_json(405, {'detail': 'Method not allowed'})
+
+        def _send_entity(self, entity: Optional[dict]) -> None:
+            if entity is None:
+                self._send_json(404, {'detail': 'Not found'})
+            else:
+                self._send_json(200, entity)
+
+        def _send_json(self, status: int, payload) -> None:
+            self._send(status, json.dumps(payload).encode(), 'application/json')
+
+        def _send(self, status: int, body: bytes, content_type: str = 'text/plain') -> None:
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Access-Control-Allow-Headers', 'Authorization, Content-Type, Accept')
+            self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
+            self.end_headers()
+            self.wfile.write(body)
+
+    return StubRequestHandler
@@ -0,0 +1,79 @@
+"""
+This module provides a background executor for teardown work (quitting drivers, deleting the
+entities a test created), so that the next test does not wait for the previous one's cleanup.
+Failures are collected and reported when the executor is flushed: at the end of every test
+class and at the end of the session.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+from typing import Callable, List, Tuple
+
+
+class TeardownExecutor:
+    """
+    Runs teardown jobs on background threads, fed through a bounded queue.
+    """
+
+    def __init__(self, max_pending: int = 16, workers: int = 2):
+        """
+        :param max_pending: How many jobs may wait in the queue before submit blocks.
+        :param workers: The number of background threads.
+        """
+        self.workers: int = workers
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._failures: List[Tuple[str, Exception]] = []
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+
+    def submit(self, description: str, job: Callable, *args, **kwargs) -> None:
+        """
+        Queues a teardown job, blocking only while the queue is full.
+
+        :param description: What the job does, used when reporting its failure.
+        :param job: The callable to run.
+        """
+        with self._lock:
+            if not self._threads:
+                self._threads = [threading.Thread(target=self._work, name=f'teardown-{index}', daemon=True)
+                                 for index in range(self.workers)]
+                for thread in self._threads:
+                    thread.start()
+        self._queue.put((description, job, args, kwargs))
+
+    def flush(self, raise_on_failure: bool = False) -> List[Tuple[str, Exception]]:
+        """
+        Waits for every queued job to finish and returns the failures collected since the last flush.
+
+        :param raise_on_failure: Raise a RuntimeError listing the failures instead of only logging them.
+        """
+        self._queue.join()
+        with self._lock:
+            failures, self._failures = self._failures, []
+        if failures and raise_on_failure:
+            raise RuntimeError(f"{len(failures)} teardown jobs failed: "
+                               + '; '.join(f"{description}: {error}" for description, error in failures))
+        return failures
+
+    def _work(self) -> None:
+        while True:
+            description, job, args, kwargs = self._queue.get()
+            try:
+                job(*args, **kwargs)
+            except Exception as e:
+                logging.error('Teardown job failed (%s): %s', description, e)
+                with self._lock:
+                    self._failures.append((description, e))
+            finally:
+                self._queue.task_done()
+
+
+def _flush_at_exit(executor: TeardownExecutor) -> None:
+    for description, error in executor.flush():
+        print(f"Teardown job failed ({description}): {error}")
+
+
+TEARDOWN_EXECUTOR = TeardownExecutor(max_pending=int(os.environ.get('TEARDOWN_QUEUE_SIZE', '16')))
+atexit.register(_flush_at_exit, TEARDOWN_EXECUTOR)
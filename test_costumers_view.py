@@ -4,7 +4,8 @@ It includes tests for adding, deleting, and verifying customer information.
 """
 
 import logging
-from typing import List
+from typing import Dict, List
+from faker import Faker
 from selenium.common import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
@@ -12,6 +13,11 @@ from selenium.webdriver.support import expected_conditions as EC
 from tests.mission_api import MissionAPIDomainCustomer
 from tests.ux_tests.ui_tests.common.base import InternalTestBase
 
+# Switching customer changes the active customer of the test account itself, so the switch test uses
+# two long-lived customers: a seeded one is deleted after the class and would leave the account on it
+BEFREE_CUSTOMER_ID = '2393ad37-2c8d-41a2-808f-1587a18dbb29'
+BORISTESTS_CUSTOMER_ID = '91c95f6c-cbf7-4115-a79d-d67c1fea0dfd'
+
 
 class TestCustomersView(InternalTestBase):
     """
@@ -19,6 +25,20 @@ class TestCustomersView(InternalTestBase):
         It includes test cases for adding new customers, validating customer data, and ensuring
         that customer entries can be properly managed within the application.
         """
+    capture_network = True
+
+    @classmethod
+    def fixture_payloads(cls) -> Dict[str, List[dict]]:
+        faker = Faker()
+        return {'customers': [{
+            'name': f'Seeded {faker.name()}',
+            'country': 'Israel',
+            'city': faker.city(),
+            'address': faker.street_address(),
+            'default_email': faker.email(),
+            'phone': faker.phone_number(),
+            'zip_code': faker.zipcode(),
+        } for _ in range(2)]}
 
     def setUp(self):
         super().setUp()
@@ -27,11 +47,12 @@ class TestCustomersView(InternalTestBase):
 
     def tearDown(self):
         super().tearDown()
-        self.__remove_customers()
+        self.defer_cleanup(f'remove the customers of {self.id()}', self.__remove_customers)
 
     def __remove_customers(self):
-        for customer_id in self.customers_to_delete:
-            self.domain_api_handler.delete_customer(customer_id)
+        result = self.domain_api_handler.delete_customers(self.customers_to_delete)
+        self.customers_to_delete.clear()
+        result.raise_for_failures()
 
     def test_add_new_customer(self):
         """
@@ -49,43 +70,19 @@ class TestCustomersView(InternalTestBase):
         random_city = self.faker.city()
         random_email = self.faker.email()
         random_phone = self.faker.phone_number()
-        random_address = self.faker.address()
+        random_address = self.faker.address().replace('\n', ', ')  # inputs drop line breaks
         random_zip_code = self.faker.zipcode()
 
-        # Find the name field
-        self.find_and_operate_on_element((By.ID, 'customer-card-name')
-                                         , lambda we, name: we.send_keys(name),
-                                         (random_name,))
-
-        # Find the country field
-        self.find_and_operate_on_element((By.ID, 'customer-card-country')
-                                         , lambda we, country: we.send_keys(country),
-                                         (random_country,))
-
-        # Find the city field
-        self.find_and_operate_on_element((By.ID, 'customer-card-city')
-                                         , lambda we, city: we.send_keys(city),
-                                         (random_city,))
-
-        # Find the address field
-        self.find_and_operate_on_element((By.ID, 'customer-card-address')
-                                         , lambda we, address: we.send_keys(address),
-                                         (random_address,))
-
-        # Find the email field
-        self.find_and_operate_on_element((By.ID, 'customer-card-default_email')
-                                         , lambda we, email: we.send_keys(email),
-                                         (random_email,))
-
-        # Find the phone field
-        self.find_and_operate_on_element((By.ID, 'customer-card-phone')
-                                         , lambda we, phone: we.send_keys(phone),
-                                         (random_phone,))
-
-        # Find the zip code field
-        self.find_and_operate_on_element((By.ID, 'customer-card-zip_code')
-                                         , lambda we, zip_code: we.send_keys(zip_code),
-                                         (random_zip_code,))
+        # Fill in all the customer card fields at once
+        self.fill_form({
+            (By.ID, 'customer-card-name'): random_name,
+            (By.ID, 'customer-card-country'): random_country,
+            (By.ID, 'customer-card-city'): random_city,
+            (By.ID, 'customer-card-address'): random_address,
+            (By.ID, 'customer-card-default_email'): random_email,
+            (By.ID, 'customer-card-phone'): random_phone,
+            (By.ID, 'customer-card-zip_code'): random_zip_code,
+        })
         try:
             # Find the container element
             self.scroll_and_save_container()
@@ -99,7 +96,10 @@ class TestCustomersView(InternalTestBase):
 
         # filter the customer
         self.find_and_operate_on_element((By.ID, 'name'), lambda we, name: we.send_keys(name), (random_name,))
-        self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click())
+        self.wait_for_requests(
+            lambda: self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click()),
+            url_patterns=('/customer?',)
+        )
 
         # Locate the customer row using the random name
         customer_element = WebDriverWait(self.driver, 10).until(
@@ -132,16 +132,19 @@ class TestCustomersView(InternalTestBase):
             """
 
         self.driver.maximize_window()
+        seeded_customer: dict = self.seeded['customers'][0]
 
         self.find_and_operate_on_element((By.ID, 'customers'), lambda we: we.click())
 
         # Filter the customer
-        self.find_and_operate_on_element((By.ID, 'name'), lambda we, name: we.send_keys(name), ('boris',))
+        self.find_and_operate_on_element((By.ID, 'name'), lambda we, name: we.send_keys(name),
+                                         (seeded_customer['name'],))
 
         self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click())
 
         # Click on the customer
-        self.find_and_operate_on_element((By.ID, '91c95f6c-cbf7-4115-a79d-d67c1fea0dfd'), lambda we: we.click())
+        # The seeded customer is new every run, keep its ID out of the wait history
+        self.find_and_operate_on_element((By.ID, seeded_customer['id']), lambda we: we.click(), record_history=False)
 
         # Generate random details using Faker
         random_email = self.faker.email()
@@ -150,22 +153,14 @@ class TestCustomersView(InternalTestBase):
         random_phone = self.faker.phone_number()
         random_zip_code = self.faker.zipcode()
 
-        # Find and clear the country field
-        self.find_and_operate_on_element((By.ID, 'customer-card-country')
-                                         , lambda we, country: we.send_keys(country),
-                                         (random_country,), clear_field=True)
-        # Find and clear the country field
-        self.find_and_operate_on_element((By.ID, 'customer-card-city'), lambda we, city: we.send_keys(city),
-                                         (random_city,), clear_field=True)
-
-        self.find_and_operate_on_element((By.ID, 'customer-card-default_email'), lambda we, email: we.send_keys(email),
-                                         (random_email,), clear_field=True)
-
-        self.find_and_operate_on_element((By.ID, 'customer-card-phone'), lambda we, phone: we.send_keys(phone),
-                                         (random_phone,), clear_field=True)
-
-        self.find_and_operate_on_element((By.ID, 'customer-card-zip_code'), lambda we, zip_code: we.send_keys(zip_code),
-                                         (random_zip_code,), clear_field=True)
+        # Replace the customer card fields at once
+        self.fill_form({
+            (By.ID, 'customer-card-country'): random_country,
+            (By.ID, 'customer-card-city'): random_city,
+            (By.ID, 'customer-card-default_email'): random_email,
+            (By.ID, 'customer-card-phone'): random_phone,
+            (By.ID, 'customer-card-zip_code'): random_zip_code,
+        })
         try:
             self.scroll_and_save_container()
         except TimeoutException:
@@ -173,7 +168,7 @@ class TestCustomersView(InternalTestBase):
 
         self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click())
 
-        customer_id: str = "91c95f6c-cbf7-4115-a79d-d67c1fea0dfd"
+        customer_id: str = seeded_customer['id']
         logging.info('Customer row found with ID: %s', customer_id)
         print(customer_id)
         customer_data: dict = self.domain_api_handler.get_customer(customer_id=customer_id)
@@ -196,15 +191,20 @@ class TestCustomersView(InternalTestBase):
         """
 
         self.driver.maximize_window()
+        seeded_customer: dict = self.seeded['customers'][1]
 
         self.find_and_operate_on_element((By.ID, 'customers'), lambda we: we.click())
 
         # Filter the customer
-        self.find_and_operate_on_element((By.ID, 'name'), lambda we, name: we.send_keys(name), ('befree',))
+        self.find_and_operate_on_element((By.ID, 'name'), lambda we, name: we.send_keys(name),
+                                         (seeded_customer['name'],))
 
-        self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click())
+        self.wait_for_requests(
+            lambda: self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click()),
+            url_patterns=('/customer?',)
+        )
 
-        customer_rows = self.driver.find_elements(By.ID, "2393ad37-2c8d-41a2-808f-1587a18dbb29")
+        customer_rows = [row for row in self.read_table()['rows'] if row['id'] == seeded_customer['id']]
         assert len(customer_rows) == 1
 
         self.find_and_operate_on_element((By.ID, 'country'), lambda we, country: we.send_keys(country), ('israel',))
@@ -230,17 +230,16 @@ class TestCustomersView(InternalTestBase):
 
         self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click())
 
-        self.find_and_operate_on_element((By.ID, '2393ad37-2c8d-41a2-808f-1587a18dbb29'), lambda we: we.click())
+        self.find_and_operate_on_element((By.ID, BEFREE_CUSTOMER_ID), lambda we: we.click())
 
         self.scroll_and_switch_container()
 
         # Wait for the specific element with text 'Befree Agro' to appear
-        element = WebDriverWait(self.driver, 20).until(
-            EC.presence_of_element_located(
-                (By.XPATH,
-                 "//span[contains(@class, 'MuiTypography-root MuiTypography-body1 MuiListItemText-primary css-ug2eej')"
-                 " and text()='Befree Agro']")
-            )
+        element = self.wait_for_element(
+            (By.XPATH,
+             "//span[contains(@class, 'MuiTypography-root MuiTypography-body1 MuiListItemText-primary css-ug2eej')"
+             " and text()='Befree Agro']"),
+            timeout=20
         )
         logging.info("Element with text 'Befree Agro' found.")
 
@@ -251,17 +250,16 @@ class TestCustomersView(InternalTestBase):
 
         self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click())
 
-        self.find_and_operate_on_element((By.ID, '91c95f6c-cbf7-4115-a79d-d67c1fea0dfd'), lambda we: we.click())
+        self.find_and_operate_on_element((By.ID, BORISTESTS_CUSTOMER_ID), lambda we: we.click())
 
         self.scroll_and_switch_container()
 
         # Wait for the specific element with text 'Boristests' to appear
-        element = WebDriverWait(self.driver, 20).until(
-            EC.presence_of_element_located(
-                (By.XPATH,
-                 "//span[contains(@class, 'MuiTypography-root MuiTypography-body1 MuiListItemText-primary css-ug2eej')"
-                 " and text()='Boristests']")
-            )
+        element = self.wait_for_element(
+            (By.XPATH,
+             "//span[contains(@class, 'MuiTypography-root MuiTypography-body1 MuiListItemText-primary css-ug2eej')"
+             " and text()='Boristests']"),
+            timeout=20
         )
         logging.info("Element with text 'Boristests' found.")
 
@@ -18,6 +18,11 @@ class TestMapsView(InternalTestBase):
         This test class contains methods to test the Maps view functionality in the web application.
         It includes test cases for adding new maps, validating map data, and managing map entries.
         """
+    # The map views need their raster tiles, so a blocking profile must keep images
+    network_profile = ('maps-needs-tiles' if InternalTestBase.network_profile not in (None, 'none')
+                       else InternalTestBase.network_profile)
+    capture_network = True
+
     def setUp(self):
         super().setUp()
         self.maps_to_delete: List[str] = []
@@ -25,11 +30,12 @@ class TestMapsView(InternalTestBase):
 
     def tearDown(self):
         super().tearDown()
-        self.__remove_maps()
+        self.defer_cleanup(f'remove the maps of {self.id()}', self.__remove_maps)
 
     def __remove_maps(self):
-        for map_id in self.maps_to_delete:
-            self.domain_api_handler.delete_map(int(map_id))
+        result = self.domain_api_handler.delete_maps([int(map_id) for map_id in self.maps_to_delete])
+        self.maps_to_delete.clear()
+        result.raise_for_failures()
 
     def test_add_new_map(self):
         """
@@ -53,7 +59,10 @@ class TestMapsView(InternalTestBase):
         # filter the map
         self.find_and_operate_on_element((By.ID, 'name'), lambda we, name: we.send_keys(name),
                                          (random_map_name,))
-        self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click())
+        self.wait_for_requests(
+            lambda: self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click()),
+            url_patterns=('/maps?',)
+        )
 
         try:
             # Locate the map element by its displayed name and get its ID
@@ -84,8 +93,12 @@ class TestMapsView(InternalTestBase):
         self.driver.maximize_window()
         self.find_and_operate_on_element((By.ID, 'maps'), lambda we: we.click())
         self.find_and_operate_on_element((By.ID, 'name'), lambda we, name: we.send_keys(name), ('test1',))
-        self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click())
-        results_text = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'p.MuiTablePagination-displayedRows.css-1chpzqh'))).text
-        results_number = int(results_text.split(' ')[2])
-        assert results_number >= 1
+        # Wait for the filtered maps to arrive, so the pagination text is not the stale one
+        self.wait_for_requests(
+            lambda: self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click()),
+            url_patterns=('/maps?',)
+        )
+        pagination = self.read_table()['pagination']
+        self.assertIsNotNone(pagination, 'The results table has no pagination')
+        self.assertIsNotNone(pagination['total'], f"No total in the pagination text: {pagination['text']!r}")
+        assert pagination['total'] >= 1
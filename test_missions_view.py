@@ -1,6 +1,7 @@
 """
 This module contains UI tests for the Mission view feature.
 """
+import re
 import time
 from typing import List
 from selenium.webdriver.common.by import By
@@ -9,19 +10,31 @@ from selenium.webdriver.support import expected_conditions as EC
 from tests.ux_tests.ui_tests.common.base import InternalTestBase
 from tests.mission_api import MissionAPIDomainMission
 
+# A recorded mission (a flight, listed on the missions page): the Mission API only creates
+# mission templates, so the navigation test cannot seed it
+NAVIGATION_MISSION_ID = '7146'
+
+# The list request of the missions page ('/mission?...' or '/missions?...'), not the mission templates one
+MISSIONS_LIST_REQUEST = re.compile(r'/missions?\?')
+
 
 class TestMissionView(InternalTestBase):
     """
     Test cases for validating the Mission view and filters.
     """
+    capture_network = True
+
     def setUp(self):
         super().setUp()
         self.missions_to_delete: List[str] = []
         self.mission_api_handler: MissionAPIDomainMission = MissionAPIDomainMission()
 
     def __remove_missions(self):
-        for mission_template_id in self.missions_to_delete:
-            self.mission_api_handler.delete_mission(int(mission_template_id))
+        result = self.mission_api_handler.delete_missions(
+            [int(mission_template_id) for mission_template_id in self.missions_to_delete]
+        )
+        self.missions_to_delete.clear()
+        result.raise_for_failures()
 
     def test_mission_filters(self):
         """
@@ -34,11 +47,15 @@ class TestMissionView(InternalTestBase):
         self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click())
         self.find_and_operate_on_element((By.ID, 'operator'), lambda we: we.click())
         self.find_and_operate_on_element((By.ID, 'f738a3a2-2f52-478b-adad-8da1f2e92af1'), lambda we: we.click())
-        self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click())
-        results_text = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'p.MuiTablePagination-displayedRows.css-1chpzqh'))).text
-        results_number = int(results_text.split(' ')[2])
-        assert results_number >= 5
+        # Wait for the filtered missions to arrive, so the pagination text is not the stale one
+        self.wait_for_requests(
+            lambda: self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click()),
+            url_patterns=(MISSIONS_LIST_REQUEST,)
+        )
+        pagination = self.read_table()['pagination']
+        self.assertIsNotNone(pagination, 'The results table has no pagination')
+        self.assertIsNotNone(pagination['total'], f"No total in the pagination text: {pagination['text']!r}")
+        assert pagination['total'] >= 5
 
     def test_navigation(self):
         """
@@ -48,7 +65,7 @@ class TestMissionView(InternalTestBase):
         self.find_and_operate_on_element((By.ID, 'missions'), lambda we: we.click())
 
         mission_found = False
-        mission_id = '7146'
+        mission_id = NAVIGATION_MISSION_ID
 
         while not mission_found:
             self.find_and_operate_on_element((By.ID, mission_id), lambda we: we.click())
@@ -75,28 +92,32 @@ class TestMissionView(InternalTestBase):
                 Tests the creation of mission templates.
         """
         self.driver.maximize_window()
-        self.find_and_operate_on_element((By.ID, 'missions'), lambda we: we.click())
-        self.find_and_operate_on_element((By.ID, 'Manage mission types'), lambda we: we.click())
-        self.find_and_operate_on_element((By.ID, 'Create Template'), lambda we: we.click())
-        self.find_and_operate_on_element((By.ID, 'template-next-button'), lambda we: we.click())
-        self.find_and_operate_on_element((By.ID, 'select-checkbox-follow_line'), lambda we: we.click())
-        self.find_and_operate_on_element((By.ID, 'template-next-button'), lambda we: we.click())
-        self.find_and_operate_on_element(
-            (By.ID, 'Scan HeightThe height at which the aircraft will take photos (meters).0'), lambda we: we.click())
-        self.find_and_operate_on_element((By.ID, '5050 meters'), lambda we: we.click())
-        self.find_and_operate_on_element((By.ID, 'Scan SpeedThe speed at which the aircraft will fly (m/s).1'),
-                                         lambda we: we.click())
-        self.find_and_operate_on_element((By.ID, '1010 m/s'), lambda we: we.click())
-        self.find_and_operate_on_element((By.ID, 'goal-settings-select-Camera Type'), lambda we: we.click())
-        self.find_and_operate_on_element((By.ID, '2Thermal Camera'), lambda we: we.click())
-        self.find_and_operate_on_element((By.ID, 'template-next-button'), lambda we: we.click())
-        random_name = self.faker.name()
-        self.find_and_operate_on_element((By.ID, 'create-template-name'), lambda we: we.send_keys(random_name))
-        self.find_and_operate_on_element((By.ID, 'create-template-description'), lambda we: we.send_keys(random_name))
-        time.sleep(5)
-        self.find_and_operate_on_element((By.ID, 'create-template'), lambda we: we.click())
-        self.find_and_operate_on_element((By.ID, 'name'), lambda we: we.send_keys(random_name))
-        self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click())
+        # The steps depend on each other: stop at the first one that fails
+        with self.step_chain():
+            self.find_and_operate_on_element((By.ID, 'missions'), lambda we: we.click())
+            self.find_and_operate_on_element((By.ID, 'Manage mission types'), lambda we: we.click())
+            self.find_and_operate_on_element((By.ID, 'Create Template'), lambda we: we.click())
+            self.find_and_operate_on_element((By.ID, 'template-next-button'), lambda we: we.click())
+            self.find_and_operate_on_element((By.ID, 'select-checkbox-follow_line'), lambda we: we.click())
+            self.find_and_operate_on_element((By.ID, 'template-next-button'), lambda we: we.click())
+            self.find_and_operate_on_element(
+                (By.ID, 'Scan HeightThe height at which the aircraft will take photos (meters).0'),
+                lambda we: we.click())
+            self.find_and_operate_on_element((By.ID, '5050 meters'), lambda we: we.click())
+            self.find_and_operate_on_element((By.ID, 'Scan SpeedThe speed at which the aircraft will fly (m/s).1'),
+                                             lambda we: we.click())
+            self.find_and_operate_on_element((By.ID, '1010 m/s'), lambda we: we.click())
+            self.find_and_operate_on_element((By.ID, 'goal-settings-select-Camera Type'), lambda we: we.click())
+            self.find_and_operate_on_element((By.ID, '2Thermal Camera'), lambda we: we.click())
+            self.find_and_operate_on_element((By.ID, 'template-next-button'), lambda we: we.click())
+            random_name = self.faker.name()
+            self.find_and_operate_on_element((By.ID, 'create-template-name'), lambda we: we.send_keys(random_name))
+            self.find_and_operate_on_element((By.ID, 'create-template-description'),
+                                             lambda we: we.send_keys(random_name))
+            time.sleep(5)
+            self.find_and_operate_on_element((By.ID, 'create-template'), lambda we: we.click())
+            self.find_and_operate_on_element((By.ID, 'name'), lambda we: we.send_keys(random_name))
+            self.find_and_operate_on_element((By.ID, 'submit-filter'), lambda we: we.click())
         mission_element = WebDriverWait(self.driver, 10).until(
             EC.presence_of_element_located(
                 (By.XPATH, f"//td[contains(text(), '{random_name}')]/..")
@@ -0,0 +1,121 @@
+"""
+This module provides adaptive wait timeouts: the time every locator took to appear is
+recorded across runs in a history file, and later waits on the locator are budgeted from
+that history (p99 times a safety factor) instead of a fixed 10 or 20 seconds, so a broken
+element fails in about a second. Locators without enough history keep the static timeout.
+A wait that times out within its adaptive budget is recorded at the budget, as a censored
+sample, so the budget of a locator that became slower grows again instead of staying stuck.
+
+Usage:
+    TIMEOUT_HISTORY=.wait_history.json python -m pytest ...
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from tests.file_lock import file_lock
+from tests.stats import percentile
+
+
+def locator_key(locator_tuple: Tuple[str, str]) -> str:
+    """
+    Returns the history key of a locator, formatted like the step spans, e.g. 'id=save'.
+    """
+    return f'{locator_tuple[0]}={locator_tuple[1]}'
+
+
+class TimeoutModel:
+    """
+    Records the observed wait durations per locator and derives timeout budgets from them.
+    """
+
+    def __init__(self, history_path: Optional[str] = None, safety_factor: float = 3,
+                 min_samples: int = 5, floor: float = 1, max_samples: int = 200):
+        """
+        :param history_path: The JSON history file shared by the runs and workers; None disables the model.
+        :param safety_factor: The multiplier applied to the p99 of the observed durations.
+        :param min_samples: How many observations a locator needs before its budget is adaptive.
+        :param floor: The minimum budget, in seconds.
+        :param max_samples: How many of the latest observations are kept per locator.
+        """
+        self.history_path: Optional[str] = history_path
+        self.safety_factor: float = safety_factor
+        self.min_samples: int = min_samples
+        self.floor: float = floor
+        self.max_samples: int = max_samples
+        self._history: Optional[Dict[str, List[float]]] = None
+        self._new_samples: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.history_path is not None
+
+    def budget(self, locator_tuple: Tuple[str, str], default: float) -> float:
+        """
+        Returns the timeout to wait for the locator: p99 of its history times the safety factor,
+        between the floor and the static default, or the default without enough history.
+
+        :param locator_tuple: The locator waited for (e.g., (By.ID, 'element_id')).
+        :param default: The static timeout, in seconds.
+        """
+        if not self.enabled:
+            return default
+        with self._lock:
+            samples = self._samples(locator_key(locator_tuple))
+        if len(samples) < self.min_samples:
+            return default
+        return min(max(percentile(samples, 99) * self.safety_factor, self.floor), default)
+
+    def record(self, locator_tuple: Tuple[str, str], duration: float) -> None:
+        """
+        Records how long a wait on the locator took. For a wait that timed out within its
+        adaptive budget, the duration is the budget: the element took at least that long.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._new_samples.setdefault(locator_key(locator_tuple), []).append(duration)
+
+    def save(self) -> None:
+        """
+        Merges the durations recorded by this process into the history file.
+        """
+        with self._lock:
+            new_samples, self._new_samples = self._new_samples, {}
+        if not self.enabled or not new_samples:
+            return
+        with file_lock(f'{self.history_path}.lock'):
+            history = self._read_history()
+            for key, samples in new_samples.items():
+                history[key] = (history.get(key, []) + samples)[-self.max_samples:]
+            with open(self.history_path, 'w', encoding='utf-8') as history_file:
+                json.dump(history, history_file)
+        with self._lock:
+            self._history = history
+
+    def _samples(self, key: str) -> List[float]:
+        if self._history is None:
+            with file_lock(f'{self.history_path}.lock'):
+                self._history = self._read_history()
+        return self._history.get(key, []) + self._new_samples.get(key, [])
+
+    def _read_history(self) -> Dict[str, List[float]]:
+        try:
+            with open(self.history_path, encoding='utf-8') as history_file:
+                return json.load(history_file)
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            logging.warning('Ignoring the unreadable wait history %s: %s', self.history_path, e)
+            return {}
+
+
+TIMEOUT_MODEL = TimeoutModel(os.environ.get('TIMEOUT_HISTORY') or None,
+                             safety_factor=float(os.environ.get('TIMEOUT_SAFETY_FACTOR', '3')),
+                             min_samples=int(os.environ.get('TIMEOUT_MIN_SAMPLES', '5')),
+                             floor=float(os.environ.get('TIMEOUT_FLOOR', '1')))
+atexit.register(TIMEOUT_MODEL.save)
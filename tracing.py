@@ -0,0 +1,168 @@
+"""
+This module provides lightweight step tracing for the tests: every traced step (driver
+startup, login, element operations, Mission API calls...) is recorded as a span with its
+duration and attributes, exported per test in the Chrome trace event format, and
+summarised across a run to rank the slowest steps and locators.
+
+Usage:
+    TEST_TRACE_DIR=traces python -m pytest ...
+    python -m tests.tracing traces --top 20
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+class Tracer:
+    """
+    Records the spans of one test.
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.spans: List[dict] = []
+        self._origin: float = time.perf_counter()
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attrs) -> Iterator[dict]:
+        """
+        Times the with block as a span. The yielded attributes dict can be completed inside
+        the block, e.g. with the split between waiting and acting.
+
+        :param name: The step name, e.g. 'step' or 'http'.
+        :param attrs: Attributes identifying the step, e.g. locator='id=save'.
+        """
+        started = time.perf_counter()
+        try:
+            yield attrs
+        finally:
+            span = {
+                'name': name,
+                'start': started - self._origin,
+                'duration': time.perf_counter() - started,
+                'thread': threading.get_ident(),
+                'attrs': attrs,
+            }
+            with self._lock:
+                self.spans.append(span)
+
+    def export(self, path: str) -> None:
+        """
+        Writes the spans to a file loadable by chrome://tracing and Perfetto. The trace may be
+        exported again as spans are added, e.g. by deferred teardown jobs.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Snapshot inside the export lock, so the last write always holds the most spans
+        with self._export_lock:
+            with self._lock:
+                spans = list(self.spans)
+            events = [{
+                'name': span['name'] if 'locator' not in span['attrs']
+                else f"{span['name']} {span['attrs']['locator']}",
+                'cat': span['name'],
+                'ph': 'X',
+                'ts': span['start'] * 1e6,
+                'dur': span['duration'] * 1e6,
+                'pid': os.getpid(),
+                'tid': span['thread'],
+                'args': span['attrs'],
+            } for span in spans]
+            with open(path, 'w', encoding='utf-8') as trace_file:
+                json.dump({'traceEvents': events, 'otherData': {'test': self.name}}, trace_file, default=str)
+
+
+_current_tracer: Tracer = Tracer('untraced')
+_thread_tracer = threading.local()
+
+
+def current_tracer() -> Tracer:
+    """
+    Returns the tracer bound to the calling thread, or else the tracer of the test currently
+    running in this process.
+    """
+    return getattr(_thread_tracer, 'tracer', None) or _current_tracer
+
+
+def set_current_tracer(tracer: Tracer) -> None:
+    """
+    Makes the tracer the one used by code that is not handed a tracer, e.g. MissionAPI.
+    """
+    global _current_tracer
+    _current_tracer = tracer
+
+
+@contextmanager
+def bound_tracer(tracer: Tracer) -> Iterator[Tracer]:
+    """
+    Makes the tracer the current one for the calling thread only, for the duration of the
+    with block, e.g. while a teardown job of a test runs after the next test has started.
+    """
+    previous = getattr(_thread_tracer, 'tracer', None)
+    _thread_tracer.tracer = tracer
+    try:
+        yield tracer
+    finally:
+        _thread_tracer.tracer = previous
+
+
+def trace_path(trace_dir: str, test_id: str) -> str:
+    """
+    Returns the trace file of a test inside the trace directory.
+    """
+    return os.path.join(trace_dir, re.sub(r'[^\w.-]', '_', test_id) + '.json')
+
+
+def summarize(trace_dir: str, top: int = 20) -> Dict[str, List[dict]]:
+    """
+    Aggregates the traces of a run and ranks the steps and locators by total time.
+
+    :param trace_dir: The directory holding the per-test trace files.
+    :param top: How many entries to keep per ranking.
+    """
+    by_step: Dict[str, List[float]] = {}
+    by_locator: Dict[str, List[float]] = {}
+    for path in glob.glob(os.path.join(trace_dir, '*.json')):
+        with open(path, encoding='utf-8') as trace_file:
+            for event in json.load(trace_file)['traceEvents']:
+                duration = event['dur'] / 1e6
+                by_step.setdefault(event['cat'], []).append(duration)
+                if 'locator' in event['args']:
+                    by_locator.setdefault(event['args']['locator'], []).append(duration)
+
+    def rank(durations: Dict[str, List[float]]) -> List[dict]:
+        rows = [{'key': key, 'count': len(values), 'total': sum(values), 'mean': sum(values) / len(values),
+                 'max': max(values)} for key, values in durations.items()]
+        return sorted(rows, key=lambda row: row['total'], reverse=True)[:top]
+
+    return {'steps': rank(by_step), 'locators': rank(by_locator)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Prints the summary of the traces of a run.
+    """
+    parser = argparse.ArgumentParser(description='Rank the slowest steps and locators of a traced run.')
+    parser.add_argument('trace_dir', help='The TEST_TRACE_DIR of the run')
+    parser.add_argument('--top', type=int, default=20, help='How many entries to show per ranking')
+    args = parser.parse_args(argv)
+
+    summary = summarize(args.trace_dir, args.top)
+    for title, rows in (('Slowest steps', summary['steps']), ('Slowest locators', summary['locators'])):
+        print(f"{title}:")
+        for row in rows:
+            print(f"  {row['total']:9.2f}s total  {row['count']:5d}x  {row['mean']:7.3f}s mean  "
+                  f"{row['max']:7.3f}s max  {row['key']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())